@@ -3,9 +3,13 @@
 Modern gradient UI with clean animations and responsive design
 """
 
+import os
+
+# Streamlit scores one property at a time; threaded BLAS/OpenMP only oversubscribes workers
+os.environ.setdefault('OMP_NUM_THREADS', '1')
+
 import streamlit as st
 import sys
-import os
 import json
 from pathlib import Path
 import time
@@ -110,12 +114,8 @@ def configure_page():
 
 
 def load_model():
-    """Load the ML model with caching"""
-    @st.cache_resource
-    def _load_model():
-        return load_predictor()
-    
-    return _load_model()
+    """Load the ML model (cached by load_predictor)"""
+    return load_predictor()
 
 
 def render_hero_section():
@@ -1464,8 +1464,6 @@ def render_feature_guide_page():
     </div>
     """, unsafe_allow_html=True)
     
-    import plotly.graph_objects as go
-    
     features = ['Living Area', 'Neighborhood', 'Overall Quality', 'Year Built', 'Garage Area', 
                'Lot Area', 'Basement Area', 'Bathrooms', 'Zoning', 'House Style']
     importance = [32, 28, 18, 12, 8, 6, 4, 3, 2, 1]
@@ -7,15 +7,137 @@ import joblib
 import pandas as pd
 import numpy as np
 import streamlit as st
+from sklearn import config_context
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple
+from operator import itemgetter
 import os
 
+try:
+    from numba import njit
+except ImportError:  # numba is optional; sklearn's predict is used without it
+    njit = None
+
+
+# Categorical encodings used by house.py: feature -> (mapping, default code)
+_ENCODERS = {
+    'MSZoning': ({'C': 0, 'RM': 1, 'RH': 2, 'RL': 3, 'FV': 4}, 3),  # Default to RL
+    'Neighborhood': ({
+        'MeadowV': 0, 'IDOTRR': 1, 'BrDale': 2, 'OldTown': 3, 'Edwards': 4,
+        'BrkSide': 5, 'Sawyer': 6, 'Blueste': 7, 'SWISU': 8, 'NAmes': 9,
+        'NPkVill': 10, 'Mitchel': 11, 'SawyerW': 12, 'Gilbert': 13, 'NWAmes': 14,
+        'Blmngtn': 15, 'CollgCr': 16, 'ClearCr': 17, 'Crawfor': 18, 'Veenker': 19,
+        'Somerst': 20, 'Timber': 21, 'StoneBr': 22, 'NoRidge': 23, 'NridgHt': 24
+    }, 12),  # Default to average
+    'RoofStyle': ({'Gable': 1, 'Hip': 2, 'Gambrel': 3, 'Mansard': 4, 'Flat': 5, 'Shed': 6}, 1),  # Default to Gable
+    'BsmtQual': ({'NA': 0, 'Fa': 1, 'TA': 2, 'Gd': 3, 'Ex': 4}, 3),  # Default to Good
+    'BsmtExposure': ({'NA': 0, 'No': 1, 'Mn': 2, 'Av': 3, 'Gd': 4}, 2),  # Default to Average
+    'HeatingQC': ({'Po': 1, 'Fa': 2, 'TA': 3, 'Gd': 4, 'Ex': 5}, 4),  # Default to Good
+    'CentralAir': ({'N': 0, 'Y': 1}, 1),  # Default to Yes
+    'KitchenQual': ({'Fa': 1, 'TA': 2, 'Gd': 3, 'Ex': 4}, 3),  # Default to Good
+    'FireplaceQu': ({'NA': 0, 'Po': 1, 'Fa': 2, 'TA': 3, 'Gd': 4, 'Ex': 5}, 3),  # Default to Average
+    'GarageType': ({'NA': 0, 'Detchd': 1, 'CarPort': 2, 'BuiltIn': 3, 'Attchd': 4}, 1),  # Default to Attached
+    'GarageFinish': ({'NA': 0, 'Unf': 1, 'RFn': 2, 'Fin': 3}, 2),  # Default to Rough Finished
+    'PavedDrive': ({'N': 0, 'P': 1, 'Y': 2}, 2),  # Default to Yes
+    'SaleCondition': ({'AdjLand': 0, 'Abnorml': 1, 'Alloca': 2, 'Family': 3, 'Normal': 4, 'Partial': 5}, 4),  # Default to Normal
+}
+
+
+# Defaults for the 61 scaler features the user does not provide (exactly like house.py)
+_DEFAULTS = {
+    'LotFrontage': 70.0,
+    'LotArea': 8000.0,
+    'Street': 1,
+    'Alley': 0,
+    'LotShape': 3,
+    'LandContour': 0,
+    'Utilities': 0,
+    'LotConfig': 4,
+    'LandSlope': 0,
+    'Condition1': 2,
+    'Condition2': 2,
+    'BldgType': 0,
+    'HouseStyle': 5,
+    'OverallCond': 5,
+    'YearBuilt': 30,  # 30 years old
+    'RoofMatl': 0,
+    'Exterior1st': 12,
+    'Exterior2nd': 12,
+    'MasVnrType': 1,
+    'MasVnrArea': 100.0,
+    'ExterQual': 3,
+    'ExterCond': 3,
+    'Foundation': 2,
+    'BsmtCond': 3,
+    'BsmtFinType1': 5,
+    'BsmtFinSF1': 400.0,
+    'BsmtFinType2': 5,
+    'BsmtFinSF2': 0.0,
+    'BsmtUnfSF': 400.0,
+    'TotalBsmtSF': 800.0,
+    'Heating': 1,
+    'Electrical': 4,
+    '2ndFlrSF': 0.0,
+    'LowQualFinSF': 0.0,
+    'BsmtHalfBath': 0,
+    'FullBath': 2,
+    'HalfBath': 0,
+    'BedroomAbvGr': 3,
+    'KitchenAbvGr': 1,
+    'TotRmsAbvGrd': 7,
+    'Functional': 6,
+    'GarageYrBlt': 30,
+    'GarageArea': 500.0,
+    'GarageQual': 3,
+    'GarageCond': 3,
+    'WoodDeckSF': 0.0,
+    'OpenPorchSF': 0.0,
+    'EnclosedPorch': 0.0,
+    '3SsnPorch': 0.0,
+    'ScreenPorch': 0.0,
+    'PoolArea': 0.0,
+    'PoolQC': 0,
+    'Fence': 0,
+    'MiscFeature': 0,
+    'MiscVal': 0.0,
+    'MoSold': 6,
+    'YrSold': 2010,
+    'SaleType': 8,
+    'LotFrontagenan': 0,
+    'MasVnrAreanan': 0,
+    'GarageYrBltnan': 0
+}
+
+
+if njit is not None:
+    # No fastmath: it would let the compiler assume x has no NaNs
+    @njit(cache=True)
+    def _predict_forest(x, children_left, children_right, feature, threshold, missing_go_to_left,
+                        value, tree_offsets):
+        """Average the leaf values of all trees for a single row"""
+        total = 0.0
+        n_trees = len(tree_offsets) - 1
+        for t in range(n_trees):
+            node = tree_offsets[t]
+            while children_left[node] != -1:
+                v = x[feature[node]]
+                # NaN follows the side sklearn learned for missing values at this split
+                if np.isnan(v):
+                    go_left = missing_go_to_left[node] != 0
+                else:
+                    go_left = v <= threshold[node]
+                if go_left:
+                    node = children_left[node]
+                else:
+                    node = children_right[node]
+            total += value[node]
+        return total / n_trees
+
 
 class HousePricePredictor:
     """Professional House Price Predictor matching house.py logic exactly"""
     
-    def __init__(self, model_path: str = "src/models/house_price_model.joblib"):
+    def __init__(self, model_path: str = "src/models/house_price_model.joblib", verbose: bool = False):
         """Initialize the predictor with model loading"""
         self.model = None
         self.scaler = None
@@ -23,6 +145,13 @@ class HousePricePredictor:
         self.scaler_features = None
         self.model_metadata = {}
         self.model_path = model_path
+        self._verbose = verbose
+        self._model_feature_set = frozenset()
+        self._model_indices = None
+        self._user_slot = {}
+        self._default_vector = None
+        self._forest = None
+        self._sorted_importances = None
         
         # Load model and related files
         self._load_model()
@@ -33,7 +162,8 @@ class HousePricePredictor:
         """Load the trained model exactly like house.py"""
         try:
             if os.path.exists(self.model_path):
-                self.model = joblib.load(self.model_path)
+                # Memory-map the tree arrays so workers share read-only pages
+                self.model = joblib.load(self.model_path, mmap_mode='r')
                 
                 # Get the 21 features the model expects (like house.py)
                 if hasattr(self.model, 'feature_names_in_'):
@@ -58,7 +188,17 @@ class HousePricePredictor:
                                 'SaleCondition'
                             ]
                 
-                print(f"Model expects: {len(self.model_features)} features")
+                self._model_feature_set = frozenset(self.model_features)
+                if self._verbose:
+                    print(f"Model expects: {len(self.model_features)} features")
+                
+                # Importances are fixed after training, so sort them once
+                if hasattr(self.model, 'feature_importances_'):
+                    pairs = zip(self.model_features, self.model.feature_importances_.tolist())
+                    self._sorted_importances = sorted(pairs, key=itemgetter(1), reverse=True)
+                
+                if njit is not None and hasattr(self.model, 'estimators_'):
+                    self._forest = self._flatten_forest()
                     
             else:
                 st.error(f"❌ Model file not found: {self.model_path}")
@@ -66,17 +206,73 @@ class HousePricePredictor:
         except Exception as e:
             st.error(f"❌ Error loading model: {str(e)}")
     
+    def _flatten_forest(self) -> Tuple[np.ndarray, ...]:
+        """Lay out all tree node arrays as contiguous flat buffers for the numba kernel"""
+        children_left, children_right, feature, threshold, missing_go_to_left, value = [], [], [], [], [], []
+        tree_offsets = [0]
+        for estimator in self.model.estimators_:
+            tree = estimator.tree_
+            offset = tree_offsets[-1]
+            # Rebase child indices so they address the concatenated buffers
+            children_left.append(np.where(tree.children_left == -1, -1, tree.children_left + offset))
+            children_right.append(np.where(tree.children_right == -1, -1, tree.children_right + offset))
+            feature.append(tree.feature)
+            threshold.append(tree.threshold)
+            # Trees from sklearn < 1.3 have no missing-value routing; NaN then fails <= and goes right
+            missing_go_to_left.append(getattr(tree, 'missing_go_to_left', np.zeros(tree.node_count, dtype=np.uint8)))
+            value.append(tree.value.ravel())
+            tree_offsets.append(offset + tree.node_count)
+        
+        # Node indices fit in int32, halving the bytes streamed per node visit
+        return (
+            np.concatenate(children_left).astype(np.int32),
+            np.concatenate(children_right).astype(np.int32),
+            np.concatenate(feature).astype(np.int32),
+            self._float32_thresholds(np.concatenate(threshold)),
+            np.concatenate(missing_go_to_left).astype(np.uint8),
+            np.concatenate(value),
+            np.array(tree_offsets, dtype=np.int32),
+        )
+    
+    @staticmethod
+    def _float32_thresholds(threshold: np.ndarray) -> np.ndarray:
+        """Narrow split thresholds to float32 without changing any float32 comparison"""
+        # Rounding toward -inf keeps x <= threshold identical for every float32 input x
+        narrowed = threshold.astype(np.float32)
+        rounded_up = narrowed > threshold
+        narrowed[rounded_up] = np.nextafter(narrowed[rounded_up], np.float32(-np.inf))
+        return narrowed
+    
+    def _predict_log(self, model_input: np.ndarray) -> float:
+        """Predict the log price for a single row of C-contiguous float32 input"""
+        if self._forest is not None:
+            return _predict_forest(model_input[0], *self._forest)
+        # The input was just built here, so sklearn's NaN/Inf scan can be skipped
+        with config_context(assume_finite=True):
+            return self.model.predict(model_input)[0]
+    
     def _load_scaler(self) -> None:
         """Load the scaler exactly like house.py"""
         try:
             scaler_path = "src/models/scaler.joblib"
             if os.path.exists(scaler_path):
-                self.scaler = joblib.load(scaler_path)
+                self.scaler = joblib.load(scaler_path, mmap_mode='r')
                 
                 # Get all 82 features the scaler expects (like house.py)
                 if hasattr(self.scaler, 'feature_names_in_'):
                     self.scaler_features = list(self.scaler.feature_names_in_)
-                    print(f"Scaler expects: {len(self.scaler_features)} features")
+                    if self._verbose:
+                        print(f"Scaler expects: {len(self.scaler_features)} features")
+                    
+                    # Slot of each scaler feature and the vector of defaults to fill them
+                    self._user_slot = {f: i for i, f in enumerate(self.scaler_features)}
+                    self._default_vector = np.array(
+                        [_DEFAULTS.get(f, 0.0) for f in self.scaler_features], dtype=np.float64
+                    )
+                    
+                    # Positions of the model's features within the scaled vector
+                    if self.model_features:
+                        self._model_indices = [self._user_slot[f] for f in self.model_features]
                 else:
                     # If scaler doesn't have feature names, we'll skip scaling
                     self.scaler_features = None
@@ -138,84 +334,32 @@ class HousePricePredictor:
             ]
         }
     
-    def create_full_feature_vector(self, user_inputs: Dict) -> List[float]:
+    def create_full_feature_vector(self, user_inputs: Dict) -> np.ndarray:
         """Create a full 82-feature vector for the scaler (exactly like house.py)"""
-        # Default values for all 82 features (matching house.py exactly)
-        default_values = {
-            # User provided features (21)
-            **user_inputs,
-            
-            # Additional features with reasonable defaults (61 more) - exactly like house.py
-            'LotFrontage': 70.0,
-            'LotArea': 8000.0,
-            'Street': 1,
-            'Alley': 0,
-            'LotShape': 3,
-            'LandContour': 0,
-            'Utilities': 0,
-            'LotConfig': 4,
-            'LandSlope': 0,
-            'Condition1': 2,
-            'Condition2': 2,
-            'BldgType': 0,
-            'HouseStyle': 5,
-            'OverallCond': 5,
-            'YearBuilt': 30,  # 30 years old
-            'RoofMatl': 0,
-            'Exterior1st': 12,
-            'Exterior2nd': 12,
-            'MasVnrType': 1,
-            'MasVnrArea': 100.0,
-            'ExterQual': 3,
-            'ExterCond': 3,
-            'Foundation': 2,
-            'BsmtCond': 3,
-            'BsmtFinType1': 5,
-            'BsmtFinSF1': 400.0,
-            'BsmtFinType2': 5,
-            'BsmtFinSF2': 0.0,
-            'BsmtUnfSF': 400.0,
-            'TotalBsmtSF': 800.0,
-            'Heating': 1,
-            'Electrical': 4,
-            '2ndFlrSF': 0.0,
-            'LowQualFinSF': 0.0,
-            'BsmtHalfBath': 0,
-            'FullBath': 2,
-            'HalfBath': 0,
-            'BedroomAbvGr': 3,
-            'KitchenAbvGr': 1,
-            'TotRmsAbvGrd': 7,
-            'Functional': 6,
-            'GarageYrBlt': 30,
-            'GarageArea': 500.0,
-            'GarageQual': 3,
-            'GarageCond': 3,
-            'WoodDeckSF': 0.0,
-            'OpenPorchSF': 0.0,
-            'EnclosedPorch': 0.0,
-            '3SsnPorch': 0.0,
-            'ScreenPorch': 0.0,
-            'PoolArea': 0.0,
-            'PoolQC': 0,
-            'Fence': 0,
-            'MiscFeature': 0,
-            'MiscVal': 0.0,
-            'MoSold': 6,
-            'YrSold': 2010,
-            'SaleType': 8,
-            'LotFrontagenan': 0,
-            'MasVnrAreanan': 0,
-            'GarageYrBltnan': 0
-        }
-        
-        # Create ordered list matching scaler's expected features
-        full_vector = []
-        for feature in self.scaler_features:
-            full_vector.append(default_values.get(feature, 0.0))
+        # Start from the precomputed defaults and overwrite the user provided slots
+        full_vector = self._default_vector.copy()
+        for feature, value in user_inputs.items():
+            slot = self._user_slot.get(feature)
+            if slot is not None:
+                full_vector[slot] = value
         
         return full_vector
     
+    def _encode_features(self, features: Dict) -> Dict:
+        """Encode the model's categorical features to numeric values like house.py"""
+        encoded_features = {}
+        for feature, value in features.items():
+            if feature in self._model_feature_set:
+                encoder = _ENCODERS.get(feature)
+                if encoder is not None:
+                    mapping, default = encoder
+                    encoded_features[feature] = mapping.get(value, default)
+                else:
+                    # Numeric feature
+                    encoded_features[feature] = float(value)
+        
+        return encoded_features
+    
     def predict_price(self, features: Dict) -> Tuple[float, Dict]:
         """
         Predict house price exactly like house.py
@@ -225,104 +369,78 @@ class HousePricePredictor:
             
         Returns:
             Tuple of (predicted_price, prediction_info)
+            
+        Raises:
+            ValueError: If the model is not loaded; other errors propagate to the caller
         """
         if not self.model:
             raise ValueError("Model not loaded")
         
-        try:
-            print(f"=== PREDICTION DEBUG (Streamlit) ===")
-            
-            # First, encode categorical features to numeric values like house.py
-            encoded_features = {}
-            for feature, value in features.items():
-                if feature in self.model_features:
-                    # Handle categorical encoding manually like house.py
-                    if feature == 'MSZoning':
-                        mapping = {'C': 0, 'RM': 1, 'RH': 2, 'RL': 3, 'FV': 4}
-                        encoded_features[feature] = mapping.get(value, 3)  # Default to RL
-                    elif feature == 'Neighborhood':
-                        mapping = {
-                            'MeadowV': 0, 'IDOTRR': 1, 'BrDale': 2, 'OldTown': 3, 'Edwards': 4,
-                            'BrkSide': 5, 'Sawyer': 6, 'Blueste': 7, 'SWISU': 8, 'NAmes': 9,
-                            'NPkVill': 10, 'Mitchel': 11, 'SawyerW': 12, 'Gilbert': 13, 'NWAmes': 14,
-                            'Blmngtn': 15, 'CollgCr': 16, 'ClearCr': 17, 'Crawfor': 18, 'Veenker': 19,
-                            'Somerst': 20, 'Timber': 21, 'StoneBr': 22, 'NoRidge': 23, 'NridgHt': 24
-                        }
-                        encoded_features[feature] = mapping.get(value, 12)  # Default to average
-                    elif feature == 'RoofStyle':
-                        mapping = {'Gable': 1, 'Hip': 2, 'Gambrel': 3, 'Mansard': 4, 'Flat': 5, 'Shed': 6}
-                        encoded_features[feature] = mapping.get(value, 1)  # Default to Gable
-                    elif feature == 'BsmtQual':
-                        mapping = {'NA': 0, 'Fa': 1, 'TA': 2, 'Gd': 3, 'Ex': 4}
-                        encoded_features[feature] = mapping.get(value, 3)  # Default to Good
-                    elif feature == 'BsmtExposure':
-                        mapping = {'NA': 0, 'No': 1, 'Mn': 2, 'Av': 3, 'Gd': 4}
-                        encoded_features[feature] = mapping.get(value, 2)  # Default to Average
-                    elif feature == 'HeatingQC':
-                        mapping = {'Po': 1, 'Fa': 2, 'TA': 3, 'Gd': 4, 'Ex': 5}
-                        encoded_features[feature] = mapping.get(value, 4)  # Default to Good
-                    elif feature == 'CentralAir':
-                        mapping = {'N': 0, 'Y': 1}
-                        encoded_features[feature] = mapping.get(value, 1)  # Default to Yes
-                    elif feature == 'KitchenQual':
-                        mapping = {'Fa': 1, 'TA': 2, 'Gd': 3, 'Ex': 4}
-                        encoded_features[feature] = mapping.get(value, 3)  # Default to Good
-                    elif feature == 'FireplaceQu':
-                        mapping = {'NA': 0, 'Po': 1, 'Fa': 2, 'TA': 3, 'Gd': 4, 'Ex': 5}
-                        encoded_features[feature] = mapping.get(value, 3)  # Default to Average
-                    elif feature == 'GarageType':
-                        mapping = {'NA': 0, 'Detchd': 1, 'CarPort': 2, 'BuiltIn': 3, 'Attchd': 4}
-                        encoded_features[feature] = mapping.get(value, 1)  # Default to Attached
-                    elif feature == 'GarageFinish':
-                        mapping = {'NA': 0, 'Unf': 1, 'RFn': 2, 'Fin': 3}
-                        encoded_features[feature] = mapping.get(value, 2)  # Default to Rough Finished
-                    elif feature == 'PavedDrive':
-                        mapping = {'N': 0, 'P': 1, 'Y': 2}
-                        encoded_features[feature] = mapping.get(value, 2)  # Default to Yes
-                    elif feature == 'SaleCondition':
-                        mapping = {'AdjLand': 0, 'Abnorml': 1, 'Alloca': 2, 'Family': 3, 'Normal': 4, 'Partial': 5}
-                        encoded_features[feature] = mapping.get(value, 4)  # Default to Normal
-                    else:
-                        # Numeric feature
-                        encoded_features[feature] = float(value)
-            
-            print(f"User provided {len(encoded_features)} features")
-            
-            if self.scaler_features:
-                # Method 1: Use scaler with full 82-feature vector (like house.py)
-                print("Using scaler with full feature vector...")
-                full_vector = self.create_full_feature_vector(encoded_features)
-                full_df = pd.DataFrame([full_vector], columns=self.scaler_features)
-                
-                # Scale all features
-                scaled_full = self.scaler.transform(full_df)
-                
-                # Extract only the 21 features the model needs
-                model_indices = [self.scaler_features.index(f) for f in self.model_features]
-                model_input = scaled_full[:, model_indices]
-                
-            else:
-                # Method 2: Skip scaler, use raw values (like house.py fallback)
-                print("Skipping scaler, using raw values...")
-                model_data = [encoded_features.get(f, 0) for f in self.model_features]
-                model_input = np.array([model_data])
+        # First, encode categorical features to numeric values like house.py
+        encoded_features = self._encode_features(features)
+        
+        if self.scaler_features:
+            # Method 1: Use scaler with full 82-feature vector (like house.py)
+            full_vector = self.create_full_feature_vector(encoded_features)
+            full_df = pd.DataFrame(full_vector.reshape(1, -1), columns=self.scaler_features)
             
-            # Make prediction
-            prediction_log = self.model.predict(model_input)[0]
-            prediction = np.exp(prediction_log)
+            # Scale all features
+            scaled_full = self.scaler.transform(full_df)
             
-            print(f"Predicted price: ${prediction:,.2f}")
+            # Extract only the 21 features the model needs
+            model_input = scaled_full[:, self._model_indices]
             
-            # Get prediction info
-            prediction_info = self._get_prediction_info(model_input, prediction, encoded_features)
+        else:
+            # Method 2: Skip scaler, use raw values (like house.py fallback)
+            model_data = [encoded_features.get(f, 0) for f in self.model_features]
+            model_input = np.array([model_data])
+        
+        # Trees compare float32 inputs, so convert once instead of inside sklearn
+        model_input = np.ascontiguousarray(model_input, dtype=np.float32)
+        
+        # Make prediction
+        prediction_log = self._predict_log(model_input)
+        prediction = np.exp(prediction_log)
+        
+        # Get prediction info
+        prediction_info = self._get_prediction_info(model_input, prediction, encoded_features)
+        
+        return prediction, prediction_info
+
+    def predict_prices(self, rows: List[Dict]) -> np.ndarray:
+        """
+        Predict prices for many properties with a single model call
+        
+        Args:
+            rows: List of feature dictionaries, one per property
             
-            return prediction, prediction_info
+        Returns:
+            Array of predicted prices in the same order as rows
+        """
+        if not self.model:
+            raise ValueError("Model not loaded")
+        
+        if not rows:
+            return np.empty(0)
+        
+        if self.scaler_features:
+            # Fill one (N, 82) matrix from the defaults and scale it once
+            full_matrix = np.tile(self._default_vector, (len(rows), 1))
+            for i, row in enumerate(rows):
+                for feature, value in self._encode_features(row).items():
+                    slot = self._user_slot.get(feature)
+                    if slot is not None:
+                        full_matrix[i, slot] = value
             
-        except Exception as e:
-            st.error(f"Prediction error: {str(e)}")
-            import traceback
-            traceback.print_exc()
-            return 0.0, {'error': str(e)}
+            scaled_full = self.scaler.transform(pd.DataFrame(full_matrix, columns=self.scaler_features))
+            model_input = scaled_full[:, self._model_indices]
+        else:
+            encoded_rows = [self._encode_features(row) for row in rows]
+            model_input = np.array([[encoded.get(f, 0) for f in self.model_features] for encoded in encoded_rows])
+        
+        model_input = np.ascontiguousarray(model_input, dtype=np.float32)
+        with config_context(assume_finite=True):
+            return np.exp(self.model.predict(model_input))
 
     def _get_prediction_info(self, feature_array: np.ndarray, prediction: float, user_inputs: Dict) -> Dict:
         """Get additional information about the prediction"""
@@ -349,9 +467,13 @@ class HousePricePredictor:
         if hasattr(self.model, 'estimators_'):
             # For ensemble models, calculate prediction std
             try:
-                predictions = [tree.predict(feature_array)[0] for tree in self.model.estimators_]
-                predictions = [np.exp(p) for p in predictions]  # Convert from log scale
-                std_dev = np.std(predictions)
+                # Query the tree structures directly to skip per-estimator input validation
+                tree_input = np.ascontiguousarray(feature_array, dtype=np.float32)
+                predictions = np.empty(len(self.model.estimators_))
+                for i, tree in enumerate(self.model.estimators_):
+                    predictions[i] = tree.tree_.predict(tree_input)[0, 0]
+                np.exp(predictions, out=predictions)  # Convert from log scale
+                std_dev = float(predictions.std())
                 info['std_deviation'] = std_dev
                 info['confidence_interval'] = {
                     'lower': max(0, prediction - 1.96 * std_dev),
@@ -374,20 +496,10 @@ class HousePricePredictor:
     
     def get_feature_importance(self, top_n: int = 10) -> Optional[Dict]:
         """Get feature importance from the model"""
-        if not self.model or not hasattr(self.model, 'feature_importances_'):
+        if not self._sorted_importances:
             return None
         
-        if not self.model_features:
-            return None
-        
-        # Get feature importances
-        importances = self.model.feature_importances_
-        feature_importance = dict(zip(self.model_features, importances))
-        
-        # Sort by importance
-        sorted_features = sorted(feature_importance.items(), key=lambda x: x[1], reverse=True)
-        
-        return dict(sorted_features[:top_n])
+        return dict(self._sorted_importances[:top_n])
     
     def validate_input(self, features: Dict) -> Tuple[bool, List[str]]:
         """Validate input features"""
@@ -496,6 +608,7 @@ class HousePricePredictor:
         }
 
 
+@st.cache_resource(show_spinner=False)
 def load_predictor() -> HousePricePredictor:
-    """Load and return a configured predictor instance"""
+    """Load and return a configured predictor instance (shared across reruns)"""
     return HousePricePredictor()
\ No newline at end of file
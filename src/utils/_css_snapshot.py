@@ -0,0 +1,7 @@
+"""
+Snapshot of assets/style.css for the House Price Prediction App
+
+Generated by tools/gen_css_snapshot.py - do not edit by hand.
+"""
+
+CSS = '/* ====== Propalytic-Inspired Modern CSS Framework ====== */\n\n/* CSS Variables for Theme System */\n:root {\n    /* Modern Neutral Color Palette */\n    --primary-50: #f8fafc;\n    --primary-100: #f1f5f9;\n    --primary-200: #e2e8f0;\n    --primary-300: #cbd5e1;\n    --primary-400: #94a3b8;\n    --primary-500: #64748b;\n    --primary-600: #475569;\n    --primary-700: #334155;\n    --primary-800: #1e293b;\n    --primary-900: #0f172a;\n\n    /* Propalytic Gradient Theme Colors */\n    --gradient-start: #667eea;\n    --gradient-middle: #764ba2;\n    --gradient-end: #f093fb;\n    \n    /* Enhanced Accent Colors for Propalytic Theme */\n    --accent-purple: #8b5cf6;\n    --accent-blue: #3b82f6;\n    --accent-cyan: #06b6d4;\n    --accent-pink: #ec4899;\n    --accent-green: #10b981;\n    --accent-orange: #f59e0b;\n    --accent-indigo: #6366f1;\n    --accent-violet: #7c3aed;\n    \n    /* Primary Colors */\n    --primary-purple: #8b5cf6;\n    --primary-blue: #3b82f6;\n    --primary-cyan: #06b6d4;\n    \n    /* Enhanced Propalytic Gradient Backgrounds */\n    --gradient-background: linear-gradient(135deg, \n        var(--gradient-start) 0%, \n        var(--gradient-middle) 50%, \n        var(--gradient-end) 100%);\n    --gradient-primary: linear-gradient(135deg, \n        var(--accent-purple) 0%, \n        var(--accent-blue) 50%, \n        var(--accent-cyan) 100%);\n    --gradient-secondary: linear-gradient(135deg, \n        var(--accent-pink) 0%, \n        var(--accent-purple) 50%, \n        var(--accent-blue) 100%);\n    --gradient-tertiary: linear-gradient(135deg,\n        var(--accent-indigo) 0%,\n        var(--accent-violet) 50%,\n        var(--accent-purple) 100%);\n    --gradient-card: linear-gradient(135deg, \n        rgba(255, 255, 255, 0.1) 0%, \n        rgba(255, 255, 255, 0.05) 100%);\n    --gradient-mesh: \n        radial-gradient(at 40% 20%, var(--accent-purple) 0px, transparent 50%),\n        radial-gradient(at 80% 0%, var(--accent-blue) 0px, transparent 50%),\n        radial-gradient(at 0% 50%, var(--accent-cyan) 0px, transparent 50%),\n        radial-gradient(at 80% 50%, var(--accent-pink) 0px, transparent 50%),\n        radial-gradient(at 0% 100%, var(--accent-violet) 0px, transparent 50%),\n        radial-gradient(at 80% 100%, var(--accent-indigo) 0px, transparent 50%),\n        radial-gradient(at 0% 0%, var(--accent-orange) 0px, transparent 50%);\n    --gradient-lines: linear-gradient(45deg, \n        transparent 40%, \n        rgba(139, 92, 246, 0.1) 50%, \n        transparent 60%);\n    \n    /* Light Theme */\n    --bg-primary: #ffffff;\n    --bg-secondary: #f8fafc;\n    --bg-tertiary: #f1f5f9;\n    --bg-surface: rgba(255, 255, 255, 0.8);\n    \n    /* Background Pattern Variables */\n    --bg-color: rgb(247, 247, 248);\n    --bg-color1: rgb(237, 238, 241);\n    --pattern-bg: repeating-linear-gradient(45deg, var(--bg-color1), var(--bg-color1) 1px, transparent 1px, transparent 4px);\n    \n    --text-primary: #0f172a;\n    --text-secondary: #475569;\n    --text-muted: #64748b;\n    --border-color: #e2e8f0;\n    --border-light: rgba(226, 232, 240, 0.5);\n    --shadow-light: rgba(0, 0, 0, 0.1);\n    --shadow-medium: rgba(0, 0, 0, 0.15);\n    --shadow-heavy: rgba(0, 0, 0, 0.25);\n    \n    /* Shadow System */\n    --shadow-sm: 0 1px 2px rgba(0, 0, 0, 0.05);\n    --shadow-md: 0 4px 6px rgba(0, 0, 0, 0.1);\n    --shadow-lg: 0 10px 15px rgba(0, 0, 0, 0.15);\n    --shadow-xl: 0 20px 25px rgba(0, 0, 0, 0.15);\n    --shadow-2xl: 0 25px 50px rgba(0, 0, 0, 0.25);\n    --shadow-glow: 0 0 20px rgba(139, 92, 246, 0.3);\n    \n    /* Spacing System */\n    --space-xs: 0.25rem;\n    --space-sm: 0.5rem;\n    --space-md: 1rem;\n    --space-lg: 1.5rem;\n    --space-xl: 2rem;\n    --space-2xl: 3rem;\n    --space-3xl: 4rem;\n    --space-4xl: 6rem;\n    \n    /* Border Radius */\n    --radius-xs: 0.125rem;\n    --radius-sm: 0.375rem;\n    --radius-md: 0.5rem;\n    --radius-lg: 0.75rem;\n    --radius-xl: 1rem;\n    --radius-2xl: 1.5rem;\n    --radius-3xl: 2rem;\n    --radius-full: 9999px;\n    \n    /* Typography */\n    --font-size-xs: 0.75rem;\n    --font-size-sm: 0.875rem;\n    --font-size-base: 1rem;\n    --font-size-lg: 1.125rem;\n    --font-size-xl: 1.25rem;\n    --font-size-2xl: 1.5rem;\n    --font-size-3xl: 1.875rem;\n    --font-size-4xl: 2.25rem;\n    --font-size-5xl: 3rem;\n    --font-size-6xl: 3.75rem;\n    \n    /* Line Heights */\n    --leading-tight: 1.25;\n    --leading-normal: 1.5;\n    --leading-relaxed: 1.75;\n    \n    /* Enhanced Animation System */\n    --transition-fast: 0.15s cubic-bezier(0.4, 0, 0.2, 1);\n    --transition-normal: 0.3s cubic-bezier(0.4, 0, 0.2, 1);\n    --transition-slow: 0.5s cubic-bezier(0.4, 0, 0.2, 1);\n    --transition-spring: 0.4s cubic-bezier(0.175, 0.885, 0.32, 1.275);\n    --bounce: cubic-bezier(0.68, -0.55, 0.265, 1.55);\n    --ease-out-expo: cubic-bezier(0.19, 1, 0.22, 1);\n    --ease-in-out-quart: cubic-bezier(0.76, 0, 0.24, 1);\n    \n    /* Propalytic Animation Presets */\n    --slide-up: translateY(20px);\n    --slide-down: translateY(-20px);\n    --slide-left: translateX(-20px);\n    --slide-right: translateX(20px);\n    --fade-in: opacity 0;\n    --scale-up: scale(0.95);\n    --scale-down: scale(1.05);\n    \n    /* Z-Index Scale */\n    --z-background: -1;\n    --z-base: 0;\n    --z-navbar: 100;\n    --z-sidebar: 200;\n    --z-modal: 1000;\n    --z-tooltip: 2000;\n    \n    /* Team Member Cards */\n    --team-member: rgb(247, 247, 248);\n}\n\n/* ====== Base Styles ====== */\n\n/* ====== Base Styles & Reset ====== */\n* {\n    margin: 0;\n    padding: 0;\n    box-sizing: border-box;\n}\n\nhtml {\n    scroll-behavior: smooth;\n    font-size: 16px;\n}\n\nbody {\n    font-family: -apple-system, BlinkMacSystemFont, \'Segoe UI\', Roboto, Oxygen, Ubuntu, Cantarell, sans-serif;\n    background: var(--pattern-bg);\n    color: var(--text-primary);\n    line-height: var(--leading-normal);\n    overflow-x: hidden;\n    padding-top: 0;\n}\n\n/* ====== Streamlit Overrides ====== */\n.stApp {\n    background: var(--bg-color, #f7f7f8) !important;\n    min-height: 100vh;\n}\n\n.main .block-container {\n    padding: 0;\n    max-width: none;\n    background: transparent;\n}\n\n/* Ensure pattern is visible in main content areas */\ndiv[data-testid="stAppViewContainer"] {\n    background: repeating-linear-gradient(45deg, var(--bg-color1, rgb(237, 238, 241)), var(--bg-color1, rgb(237, 238, 241)) 1px, transparent 1px, transparent 4px);\n}\n\ndiv[data-testid="stAppViewContainer"] > .main {\n    background: transparent;\n}\n\n/* ====== Main Content Padding for Fixed Navbar ====== */\n.main .block-container {\n    padding-top: 60px !important;\n    max-width: none;\n}\n\n.stApp > .main {\n    padding-top: 60px;\n}\n\n/* Ensure content doesn\'t get hidden behind navbar */\nbody {\n    padding-top: 0;\n}\n\n/* Override Streamlit default padding */\n.stMainBlockContainer,\n.block-container,\n.st-emotion-cache-zy6yx3,\n.elbt1zu4 {\n    padding: 0 5rem !important;\n}\n\n@media (max-width: 1024px) {\n    .stMainBlockContainer,\n    .block-container,\n    .st-emotion-cache-zy6yx3,\n    .elbt1zu4 {\n        padding: 0 2rem !important;\n    }\n}\n\n@media (max-width: 768px) {\n    .stMainBlockContainer,\n    .block-container,\n    .st-emotion-cache-zy6yx3,\n    .elbt1zu4 {\n        padding: 0 1rem !important;\n    }\n}\n\n#MainMenu, header, footer {\n    visibility: hidden;\n}\n\n.stDeployButton {\n    visibility: hidden;\n}\n\n/* ====== Propalytic Modern Navigation ====== */\n.modern-nav {\n    position: sticky;\n    top: 0;\n    z-index: var(--z-navbar);\n    background: rgba(15, 23, 42, 0.4);\n    backdrop-filter: blur(24px) saturate(180%);\n    border-bottom: 1px solid rgba(51, 65, 85, 0.2);\n    transition: all var(--transition-normal);\n    transform: translateY(0);\n}\n\n.modern-nav.scrolled {\n    box-shadow: var(--shadow-xl);\n    background: rgba(15, 23, 42, 0.6);\n    backdrop-filter: blur(32px) saturate(200%);\n    transform: translateY(-1px);\n}\n\n.nav-container {\n    max-width: 1400px;\n    margin: 0 auto;\n    padding: 0 var(--space-xl);\n    display: flex;\n    align-items: center;\n    justify-content: space-between;\n    height: 80px;\n}\n\n.nav-logo {\n    display: flex;\n    align-items: center;\n    gap: var(--space-md);\n    font-weight: 700;\n    font-size: var(--font-size-xl);\n    color: var(--text-primary);\n    text-decoration: none;\n    transition: all var(--transition-normal);\n}\n\n.nav-logo:hover {\n    transform: scale(1.05);\n}\n\n.nav-logo-icon {\n    width: 48px;\n    height: 48px;\n    background: var(--gradient-primary);\n    border-radius: var(--radius-xl);\n    display: flex;\n    align-items: center;\n    justify-content: center;\n    font-size: var(--font-size-xl);\n    animation: logoFloat 6s ease-in-out infinite;\n    box-shadow: var(--shadow-lg);\n    position: relative;\n    overflow: hidden;\n}\n\n.nav-logo-icon::before {\n    content: \'\';\n    position: absolute;\n    top: 0;\n    left: -100%;\n    width: 100%;\n    height: 100%;\n    background: linear-gradient(90deg, transparent, rgba(255,255,255,0.4), transparent);\n    transition: all 0.6s ease;\n}\n\n.nav-logo:hover .nav-logo-icon::before {\n    left: 100%;\n}\n\n@keyframes logoFloat {\n    0%, 100% { \n        transform: translateY(0px);\n        box-shadow: var(--shadow-lg);\n    }\n    50% { \n        transform: translateY(-5px);\n        box-shadow: var(--shadow-xl);\n    }\n}\n\n.nav-links {\n    display: flex;\n    align-items: center;\n    gap: var(--space-sm);\n}\n\n.nav-link {\n    padding: var(--space-md) var(--space-lg);\n    border-radius: var(--radius-xl);\n    color: var(--text-secondary);\n    text-decoration: none;\n    font-weight: 500;\n    font-size: var(--font-size-sm);\n    transition: all var(--transition-spring);\n    position: relative;\n    background: transparent;\n    border: 1px solid transparent;\n    overflow: hidden;\n}\n\n.nav-link::before {\n    content: \'\';\n    position: absolute;\n    top: 0;\n    left: 0;\n    width: 100%;\n    height: 100%;\n    background: var(--gradient-primary);\n    opacity: 0;\n    transition: all var(--transition-normal);\n    z-index: -1;\n    transform: scale(0.8);\n}\n\n.nav-link:hover {\n    color: var(--text-primary);\n    transform: translateY(-2px) scale(1.05);\n    box-shadow: var(--shadow-lg);\n    border-color: var(--accent-purple);\n}\n\n.nav-link:hover::before {\n    opacity: 0.1;\n    transform: scale(1);\n}\n\n.nav-link.active {\n    background: var(--gradient-primary);\n    color: white;\n    box-shadow: var(--shadow-glow);\n    transform: translateY(-1px);\n}\n\n.nav-link.active::before {\n    opacity: 0;\n}\n\n/* ====== Responsive Navbar for Streamlit Option Menu ====== */\n\n/* Desktop navbar positioning */\ndiv[data-testid="stHorizontalBlock"] .stOptionMenu {\n    position: fixed !important;\n    top: 15px !important;\n    left: 50% !important;\n    transform: translateX(-50%) !important;\n    z-index: var(--z-navbar) !important;\n    background: rgba(248, 250, 252, 0.95) !important;\n    backdrop-filter: blur(24px) saturate(180%) !important;\n    border: 1px solid var(--border-light) !important;\n    border-radius: var(--radius-2xl) !important;\n    padding: var(--space-sm) !important;\n    box-shadow: var(--shadow-xl) !important;\n    max-width: 90vw !important;\n    width: auto !important;\n    overflow-x: auto !important;\n}\n\n/* Tablet responsive (1024px and below) */\n@media (max-width: 1024px) {\n    div[data-testid="stHorizontalBlock"] .stOptionMenu {\n        top: 10px !important;\n        max-width: 95vw !important;\n        padding: var(--space-xs) !important;\n    }\n    \n    .stOptionMenu .nav-link {\n        font-size: 0.8rem !important;\n        padding: var(--space-sm) var(--space-md) !important;\n        margin: 0 2px !important;\n    }\n}\n\n/* Mobile responsive (768px and below) */\n@media (max-width: 768px) {\n    div[data-testid="stHorizontalBlock"] .stOptionMenu {\n        position: relative !important;\n        top: 0 !important;\n        left: 0 !important;\n        transform: none !important;\n        margin: var(--space-md) 0 !important;\n        width: 100% !important;\n        max-width: 100% !important;\n        background: rgba(248, 250, 252, 0.98) !important;\n        border-radius: var(--radius-xl) !important;\n        padding: var(--space-sm) !important;\n    }\n    \n    .stOptionMenu nav > ul {\n        justify-content: space-around !important;\n        flex-wrap: wrap !important;\n        gap: 4px !important;\n    }\n    \n    .stOptionMenu .nav-link {\n        font-size: 0.75rem !important;\n        padding: var(--space-sm) var(--space-md) !important;\n        margin: 2px !important;\n        border-radius: var(--radius-lg) !important;\n        min-width: 70px !important;\n        text-align: center !important;\n    }\n}\n\n/* Small mobile (480px and below) */\n@media (max-width: 480px) {\n    div[data-testid="stHorizontalBlock"] .stOptionMenu {\n        margin: var(--space-sm) 0 !important;\n        padding: var(--space-xs) !important;\n        background: rgba(248, 250, 252, 1) !important;\n        border-radius: var(--radius-lg) !important;\n    }\n    \n    .stOptionMenu nav > ul {\n        flex-direction: column !important;\n        gap: var(--space-xs) !important;\n        align-items: stretch !important;\n    }\n    \n    .stOptionMenu .nav-link {\n        font-size: 0.9rem !important;\n        padding: var(--space-md) !important;\n        margin: 0 !important;\n        width: 100% !important;\n        text-align: center !important;\n        border-radius: var(--radius-md) !important;\n    }\n}\n\n/* Dark theme responsive adjustments */\n[data-theme="dark"] div[data-testid="stHorizontalBlock"] .stOptionMenu {\n    background: rgba(15, 23, 42, 0.95) !important;\n    border-color: rgba(51, 65, 85, 0.5) !important;\n}\n\n@media (max-width: 768px) {\n    [data-theme="dark"] div[data-testid="stHorizontalBlock"] .stOptionMenu {\n        background: rgba(15, 23, 42, 0.98) !important;\n    }\n}\n\n@media (max-width: 480px) {\n    [data-theme="dark"] div[data-testid="stHorizontalBlock"] .stOptionMenu {\n        background: rgba(15, 23, 42, 1) !important;\n    }\n}\n\n/* Improved hover states for mobile */\n@media (hover: none) {\n    .stOptionMenu .nav-link:hover {\n        transform: none !important;\n        box-shadow: var(--shadow-md) !important;\n    }\n}\n\n/* Enhanced active states for touch devices */\n@media (max-width: 768px) {\n    .stOptionMenu .nav-link:active {\n        transform: scale(0.95) !important;\n        background: var(--gradient-primary) !important;\n        color: white !important;\n    }\n}\n\n/* Navbar scroll handling for mobile */\n.stOptionMenu {\n    overflow-x: auto !important;\n    -webkit-overflow-scrolling: touch !important;\n    scrollbar-width: none !important;\n    -ms-overflow-style: none !important;\n}\n\n.stOptionMenu::-webkit-scrollbar {\n    display: none !important;\n}\n\n/* Enhanced responsive padding for main content with navbar */\n@media (max-width: 1200px) {\n    .main .block-container {\n        padding-top: 110px !important;\n    }\n}\n\n@media (max-width: 992px) {\n    .main .block-container {\n        padding-top: 100px !important;\n    }\n}\n\n@media (max-width: 768px) {\n    .main .block-container {\n        padding-top: 20px !important;\n    }\n}\n\n@media (max-width: 480px) {\n    .main .block-container {\n        padding-top: 10px !important;\n    }\n}\n\n/* ====== Propalytic Theme Toggle ====== */\n.theme-toggle {\n    padding: var(--space-sm);\n    border-radius: var(--radius-lg);\n    background: var(--bg-tertiary);\n    border: 1px solid var(--border-color);\n    cursor: pointer;\n    transition: all var(--transition-normal);\n    display: flex;\n    align-items: center;\n    gap: var(--space-sm);\n}\n\n.theme-toggle:hover {\n    transform: scale(1.05);\n    box-shadow: var(--shadow-md);\n}\n\n.nav-link::before {\n    content: \'\';\n    position: absolute;\n    top: 0;\n    left: -100%;\n    width: 100%;\n    height: 100%;\n    background: var(--gradient-primary);\n    transition: left var(--transition-normal);\n    z-index: -1;\n    border-radius: var(--radius-lg);\n}\n\n.nav-link:hover::before,\n.nav-link.active::before {\n    left: 0;\n}\n\n.nav-link:hover,\n.nav-link.active {\n    color: white;\n    transform: translateY(-2px);\n}\n\n/* ====== Propalytic Modern Cards ====== */\n.modern-card {\n    background: rgba(255, 255, 255, 0.8);\n    backdrop-filter: blur(24px) saturate(180%);\n    border: 1px solid var(--border-light);\n    border-radius: var(--radius-2xl);\n    padding: var(--space-xl);\n    box-shadow: var(--shadow-md);\n    transition: all var(--transition-spring);\n    position: relative;\n    overflow: hidden;\n    transform: translateY(0);\n}\n\n.modern-card::before {\n    content: \'\';\n    position: absolute;\n    top: 0;\n    left: 0;\n    right: 0;\n    height: 2px;\n    background: var(--gradient-primary);\n    opacity: 0;\n    transition: all var(--transition-normal);\n    transform: translateX(-100%);\n}\n\n.modern-card::after {\n    content: \'\';\n    position: absolute;\n    top: 0;\n    left: 0;\n    width: 100%;\n    height: 100%;\n    background: var(--gradient-primary);\n    opacity: 0;\n    transition: all var(--transition-slow);\n    z-index: -1;\n    border-radius: var(--radius-2xl);\n}\n\n.modern-card:hover {\n    transform: translateY(-8px) scale(1.02);\n    box-shadow: var(--shadow-2xl);\n    border-color: rgba(139, 92, 246, 0.3);\n}\n\n.modern-card:hover::before {\n    opacity: 1;\n    transform: translateX(0);\n}\n\n.modern-card:hover::after {\n    opacity: 0.05;\n}\n\n/* ====== Enhanced Feature Cards ====== */\n.feature-cards-container {\n    display: grid;\n    grid-template-columns: 1fr;\n    gap: var(--space-xl);\n    margin: var(--space-2xl) 0;\n    animation: slideUpStagger 0.8s ease-out;\n}\n\n@keyframes slideUpStagger {\n    0% {\n        opacity: 0;\n        transform: translateY(30px);\n    }\n    100% {\n        opacity: 1;\n        transform: translateY(0);\n    }\n}\n\n@media (min-width: 768px) {\n    .feature-cards-container {\n        grid-template-columns: 1fr 1fr;\n    }\n}\n\n.feature-card {\n    background: rgba(255, 255, 255, 0.9);\n    backdrop-filter: blur(20px);\n    border: 2px solid var(--border-light);\n    border-radius: var(--radius-2xl);\n    padding: var(--space-xl);\n    transition: all var(--transition-spring);\n    position: relative;\n    overflow: hidden;\n    cursor: pointer;\n    transform: translateY(0) scale(1);\n}\n\n.feature-card::before {\n    content: \'\';\n    position: absolute;\n    top: 0;\n    left: 0;\n    right: 0;\n    height: 4px;\n    background: var(--gradient-primary);\n    transform: translateX(-100%);\n    transition: transform var(--transition-slow);\n}\n\n.feature-card::after {\n    content: \'\';\n    position: absolute;\n    top: 50%;\n    left: 50%;\n    width: 0;\n    height: 0;\n    background: radial-gradient(circle, rgba(139, 92, 246, 0.1) 0%, transparent 70%);\n    transition: all var(--transition-slow);\n    border-radius: 50%;\n    transform: translate(-50%, -50%);\n}\n\n.feature-card:hover {\n    transform: translateY(-12px) scale(1.03);\n    box-shadow: var(--shadow-2xl);\n    border-color: var(--accent-purple);\n}\n\n.feature-card:hover::before {\n    transform: translateX(0);\n}\n\n.feature-card:hover::after {\n    width: 200px;\n    height: 200px;\n}\n\n/* ====== Feature Card Components ====== */\n.feature-card-header {\n    display: flex;\n    align-items: center;\n    gap: var(--space-md);\n    margin-bottom: var(--space-lg);\n}\n\n.feature-card-icon {\n    width: 60px;\n    height: 60px;\n    background: var(--gradient-primary);\n    border-radius: var(--radius-xl);\n    display: flex;\n    align-items: center;\n    justify-content: center;\n    font-size: var(--font-size-2xl);\n    box-shadow: var(--shadow-lg);\n    transition: all var(--transition-normal);\n    position: relative;\n    overflow: hidden;\n}\n\n.feature-card-icon::before {\n    content: \'\';\n    position: absolute;\n    top: 0;\n    left: -100%;\n    width: 100%;\n    height: 100%;\n    background: linear-gradient(90deg, transparent, rgba(255,255,255,0.3), transparent);\n    transition: all 0.6s ease;\n}\n\n.feature-card:hover .feature-card-icon::before {\n    left: 100%;\n}\n\n.feature-card:hover .feature-card-icon {\n    transform: scale(1.1) rotate(5deg);\n    box-shadow: var(--shadow-xl);\n}\n\n.feature-card-title {\n    font-size: var(--font-size-xl);\n    font-weight: 700;\n    color: var(--text-primary);\n    margin: 0;\n}\n\n.feature-card-subtitle {\n    color: var(--text-secondary);\n    font-size: var(--font-size-sm);\n    margin: var(--space-xs) 0 0 0;\n    font-weight: 400;\n}\n\n.feature-card-description {\n    color: var(--text-secondary);\n    font-size: var(--font-size-sm);\n    margin-top: var(--space-md);\n    line-height: var(--leading-relaxed);\n}\n\n/* ====== Propalytic Hero Section ====== */\n.hero-container {\n    min-height: 80vh;\n    display: flex;\n    align-items: center;\n    justify-content: center;\n    position: relative;\n    padding: var(--space-4xl) var(--space-lg);\n    text-align: center;\n    background: radial-gradient(ellipse at center, rgba(139, 92, 246, 0.05) 0%, transparent 70%);\n}\n\n.hero-content {\n    max-width: 1000px;\n    margin: 0 auto;\n    z-index: 1;\n    position: relative;\n}\n\n.hero-badge {\n    display: inline-flex;\n    align-items: center;\n    gap: var(--space-sm);\n    background: rgba(139, 92, 246, 0.1);\n    backdrop-filter: blur(20px);\n    border: 1px solid rgba(139, 92, 246, 0.2);\n    border-radius: var(--radius-full);\n    padding: var(--space-sm) var(--space-lg);\n    margin-bottom: var(--space-xl);\n    animation: badgeFloat 1s ease-out;\n    transition: all var(--transition-normal);\n}\n\n.hero-badge:hover {\n    transform: scale(1.05);\n    background: rgba(139, 92, 246, 0.15);\n    border-color: rgba(139, 92, 246, 0.3);\n}\n\n.badge-icon {\n    font-size: var(--font-size-lg);\n}\n\n.badge-text {\n    font-weight: 600;\n    color: var(--accent-purple);\n    font-size: var(--font-size-sm);\n}\n\n.hero-title {\n    font-size: clamp(2.5rem, 5vw, 4rem);\n    font-weight: 800;\n    margin-bottom: var(--space-xl);\n    line-height: var(--leading-tight);\n    animation: titleSlideUp 1s ease-out 0.2s both;\n}\n\n.gradient-text {\n    background: var(--gradient-primary);\n    background-clip: text;\n    -webkit-background-clip: text;\n    -webkit-text-fill-color: transparent;\n    position: relative;\n}\n\n.hero-description {\n    font-size: var(--font-size-xl);\n    color: var(--text-secondary);\n    max-width: 700px;\n    margin: 0 auto var(--space-2xl);\n    line-height: var(--leading-relaxed);\n    animation: fadeInUp 1s ease-out 0.4s both;\n    text-align: center;\n    display: inline-flex;\n    align-items: center;\n    justify-content: center;\n    width: 100%;\n}\n\n/* Hero Stats Section */\n.hero-stats {\n    display: grid;\n    grid-template-columns: repeat(3, 1fr);\n    gap: var(--space-xl);\n    margin-top: var(--space-2xl);\n    animation: fadeInUp 1s ease-out 0.6s both;\n}\n\n.stat-item {\n    text-align: center;\n    padding: var(--space-lg);\n    background: rgba(255, 255, 255, 0.1);\n    backdrop-filter: blur(20px);\n    border: 1px solid rgba(255, 255, 255, 0.2);\n    border-radius: var(--radius-xl);\n    transition: all var(--transition-normal);\n    box-shadow: var(--shadow-sm);\n}\n\n.stat-item:hover {\n    transform: translateY(-4px) scale(1.05);\n    background: rgba(139, 92, 246, 0.1);\n    border-color: rgba(139, 92, 246, 0.3);\n    box-shadow: var(--shadow-lg);\n}\n\n.stat-number {\n    font-size: var(--font-size-3xl);\n    font-weight: 800;\n    background: var(--gradient-primary);\n    background-clip: text;\n    -webkit-background-clip: text;\n    -webkit-text-fill-color: transparent;\n    margin-bottom: var(--space-xs);\n}\n\n.stat-label {\n    font-size: var(--font-size-sm);\n    color: var(--text-secondary);\n    font-weight: 600;\n    text-transform: uppercase;\n    letter-spacing: 0.5px;\n}\n\n/* ====== New Component Styles ====== */\n\n/* Model Success Container - Three Column Layout */\n.model-success-container {\n    background: linear-gradient(135deg, rgb(16, 185, 129) 0%, rgb(5, 150, 105) 100%);\n    color: white;\n    border-radius: 12px;\n    margin: 20px 0;\n    box-shadow: 0 4px 15px rgba(16, 185, 129, 0.3);\n    overflow: hidden;\n    width: 100%;\n    min-height: 100%;\n    display: flex;\n    align-items: center;\n    justify-content: center;\n}\n\n.model-success-content {\n    display: grid;\n    grid-template-columns: repeat(3, 1fr);\n    gap: 0;\n    align-items: center;\n}\n\n.model-success-item {\n    padding: 15px 20px;\n    text-align: center;\n    border-right: 1px solid rgba(255, 255, 255, 0.2);\n    transition: all var(--transition-normal);\n}\n\n.model-success-item:last-child {\n    border-right: none;\n}\n\n.model-success-item:hover {\n    background: rgba(255, 255, 255, 0.1);\n    transform: scale(1.05);\n}\n\n.model-success-label {\n    font-size: 0.9rem;\n    opacity: 0.9;\n    margin-bottom: 4px;\n    font-weight: 500;\n}\n\n.model-success-value {\n    font-size: 1.1rem;\n    font-weight: 700;\n}\n\n@media (max-width: 768px) {\n    .model-success-content {\n        grid-template-columns: 1fr;\n    }\n    \n    .model-success-item {\n        border-right: none;\n        border-bottom: 1px solid rgba(255, 255, 255, 0.2);\n        padding: 12px 20px;\n    }\n    \n    .model-success-item:last-child {\n        border-bottom: none;\n    }\n}\n\n/* Responsive Metrics for Prediction Results */\n.responsive-metric {\n    background: rgba(255, 255, 255, 0.1);\n    backdrop-filter: blur(20px);\n    border: 1px solid rgba(255, 255, 255, 0.2);\n    border-radius: var(--radius-xl);\n    padding: var(--space-lg);\n    text-align: center;\n    transition: all var(--transition-normal);\n    margin-bottom: var(--space-md);\n    box-shadow: var(--shadow-sm);\n}\n\n.responsive-metric:hover {\n    transform: translateY(-2px) scale(1.02);\n    box-shadow: var(--shadow-lg);\n    border-color: var(--accent-purple);\n}\n\n.metric-label {\n    font-size: 0.9rem;\n    color: var(--text-secondary);\n    font-weight: 600;\n    margin-bottom: var(--space-sm);\n    text-transform: uppercase;\n    letter-spacing: 0.5px;\n}\n\n.metric-value {\n    font-size: 1.5rem;\n    font-weight: 800;\n    background: var(--gradient-primary);\n    background-clip: text;\n    -webkit-background-clip: text;\n    -webkit-text-fill-color: transparent;\n    line-height: 1.2;\n}\n\n.metric-value.large {\n    font-size: 2rem;\n}\n\n.metric-value.small {\n    font-size: 1.2rem;\n    line-height: 1.3;\n}\n\n@media (max-width: 768px) {\n    .responsive-metric {\n        padding: var(--space-md);\n        margin-bottom: var(--space-sm);\n    }\n    \n    .metric-label {\n        font-size: 0.8rem;\n    }\n    \n    .metric-value {\n        font-size: 1.2rem;\n    }\n    \n    .metric-value.large {\n        font-size: 1.5rem;\n    }\n    \n    .metric-value.small {\n        font-size: 1rem;\n    }\n}\n\n/* Hero Description Center */\n.hero-description {\n    text-align: center;\n    display: inline-flex;\n    align-items: center;\n    justify-content: center;\n    width: 100%;\n}\n\n/* Section Titles */\n.section-title {\n    font-size: 2rem;\n    font-weight: 700;\n    text-align: center;\n    margin: 2rem 0 1rem 0;\n    background: var(--gradient-primary);\n    -webkit-background-clip: text;\n    -webkit-text-fill-color: transparent;\n    background-clip: text;\n}\n\n.section-description {\n    text-align: center;\n    color: var(--text-secondary);\n    margin-bottom: 2rem;\n}\n\n/* Configuration Section */\n.configuration-section {\n    background: var(--bg-secondary);\n    border-radius: 16px;\n    padding: 24px;\n    margin: 20px 0;\n    border: 1px solid var(--border-color);\n    box-shadow: var(--shadow-lg);\n}\n\n/* Feature Input Styling */\n.feature-input-label {\n    color: var(--text-primary);\n    font-weight: 600;\n    font-size: 0.95rem;\n    margin-bottom: 8px;\n    display: block;\n}\n\n.feature-description {\n    color: var(--text-secondary);\n    font-size: 0.85rem;\n    margin-bottom: 12px;\n    line-height: 1.4;\n}\n\n/* Additional Features Card */\n.additional-features-card {\n    background: rgba(255, 255, 255, 0.95);\n    backdrop-filter: blur(24px);\n    border: 2px solid var(--border-light);\n    border-radius: var(--radius-2xl);\n    padding: var(--space-xl);\n    margin: var(--space-lg) 0 0 0;\n    box-shadow: var(--shadow-lg);\n    transition: all var(--transition-normal);\n}\n\n.additional-features-card:hover {\n    transform: translateY(-2px);\n    box-shadow: var(--shadow-xl);\n    border-color: var(--accent-purple);\n}\n\n.additional-feature-item {\n    display: flex;\n    align-items: center;\n    justify-content: space-between;\n    padding: var(--space-md);\n    background: rgba(139, 92, 246, 0.05);\n    border: 1px solid rgba(139, 92, 246, 0.2);\n    border-radius: var(--radius-lg);\n    margin: var(--space-sm) 0;\n    transition: all var(--transition-normal);\n}\n\n.additional-feature-item:hover {\n    background: rgba(139, 92, 246, 0.1);\n    border-color: rgba(139, 92, 246, 0.3);\n    transform: translateX(4px);\n}\n\n.additional-feature-text {\n    color: var(--text-primary);\n    font-weight: 600;\n    font-size: 0.95rem;\n}\n\n[data-theme="dark"] .additional-feature-text {\n    color: #e2e8f0;\n}\n\n.remove-feature-btn {\n    background: linear-gradient(135deg, #ef4444, #dc2626);\n    color: white;\n    border: none;\n    border-radius: var(--radius-lg);\n    padding: var(--space-xs) var(--space-sm);\n    font-size: 0.8rem;\n    font-weight: 600;\n    cursor: pointer;\n    transition: all var(--transition-normal);\n    box-shadow: var(--shadow-sm);\n}\n\n.remove-feature-btn:hover {\n    background: linear-gradient(135deg, #dc2626, #b91c1c);\n    transform: scale(1.05);\n    box-shadow: var(--shadow-md);\n}\n\n/* Responsive Metrics Styling */\n.responsive-metric {\n    background: rgba(255, 255, 255, 0.95);\n    backdrop-filter: blur(20px);\n    border: 1px solid var(--border-light);\n    border-radius: var(--radius-xl);\n    padding: var(--space-lg);\n    text-align: center;\n    box-shadow: var(--shadow-md);\n    transition: all var(--transition-normal);\n    min-height: 120px;\n    display: flex;\n    flex-direction: column;\n    justify-content: center;\n}\n\n[data-theme="dark"] .responsive-metric {\n    background: rgba(15, 23, 42, 0.95);\n    border-color: rgba(94, 106, 120, 0.3);\n}\n\n.responsive-metric:hover {\n    transform: translateY(-2px);\n    box-shadow: var(--shadow-lg);\n    border-color: var(--accent-purple);\n}\n\n.metric-label {\n    font-size: 0.9rem;\n    color: var(--text-secondary);\n    font-weight: 600;\n    margin-bottom: var(--space-sm);\n    text-transform: uppercase;\n    letter-spacing: 0.5px;\n}\n\n[data-theme="dark"] .metric-label {\n    color: #94a3b8;\n}\n\n.metric-value {\n    font-size: 1.5rem;\n    font-weight: 800;\n    color: var(--text-primary);\n    word-wrap: break-word;\n    line-height: 1.2;\n}\n\n[data-theme="dark"] .metric-value {\n    color: #e2e8f0;\n}\n\n.metric-value.large {\n    font-size: 1.8rem;\n}\n\n.metric-value.small {\n    font-size: 1.2rem;\n}\n\n@media (max-width: 768px) {\n    .metric-value {\n        font-size: 1.2rem;\n    }\n    \n    .metric-value.large {\n        font-size: 1.4rem;\n    }\n    \n    .metric-label {\n        font-size: 0.8rem;\n    }\n}\n\n/* Budget Analyzer */\n.budget-analyzer {\n    background: var(--bg-secondary);\n    border-radius: 16px;\n    padding: 24px;\n    margin: 20px 0;\n    border: 1px solid var(--border-color);\n    box-shadow: var(--shadow-lg);\n}\n\n.budget-analyzer .section-title {\n    color: var(--text-primary) !important;\n    -webkit-text-fill-color: var(--text-primary) !important;\n}\n\n/* Feature Section Cards */\n.feature-section-card {\n    background: var(--bg-secondary);\n    border-radius: 16px;\n    padding: 20px;\n    margin: 16px 0;\n    border: 1px solid var(--border-color);\n    box-shadow: var(--shadow-md);\n    transition: all 0.3s ease;\n}\n\n.feature-section-card:hover {\n    transform: translateY(-2px);\n    box-shadow: var(--shadow-xl);\n}\n\n.feature-section-title {\n    font-size: 1.5rem;\n    font-weight: 600;\n    margin: 0;\n    color: #1e293b !important;\n}\n\n/* Prediction Section */\n.prediction-section {\n    background: var(--bg-secondary);\n    border-radius: 16px;\n    padding: 24px;\n    margin: 20px 0;\n    border: 1px solid var(--border-color);\n    box-shadow: var(--shadow-lg);\n    text-align: center;\n}\n\n/* Stats Cards */\n.stats-card {\n    background: var(--bg-secondary);\n    border-radius: 16px;\n    padding: 24px;\n    margin: 16px 0;\n    border: 1px solid var(--border-color);\n    box-shadow: var(--shadow-md);\n    transition: all 0.3s ease;\n}\n\n.stats-card:hover {\n    transform: translateY(-2px);\n    box-shadow: var(--shadow-xl);\n}\n\n/* ====== Model Success Container ====== */\n.model-success-container {\n    background: linear-gradient(135deg, rgb(16, 185, 129) 0%, rgb(5, 150, 105) 100%);\n    color: white;\n    padding: 15px 20px;\n    border-radius: 12px;\n    text-align: center;\n    margin: 20px 0;\n    font-size: 1.1rem;\n    font-weight: 600;\n    box-shadow: 0 4px 12px rgba(16, 185, 129, 0.3);\n    width: 100%;\n    min-height: 100%;\n    display: flex;\n    align-items: center;\n    justify-content: center;\n}\n\n/* ====== Transparent Navbar ====== */\n.propalytic-navbar {\n    background: rgba(15, 23, 42, 0.8) !important;\n    backdrop-filter: blur(10px);\n    border-bottom: 1px solid rgba(255, 255, 255, 0.1);\n}\n\n/* ====== Section Titles ====== */\n.section-title {\n    font-size: 1.8rem;\n    font-weight: 700;\n    margin: 30px 0 15px 0;\n    background: var(--gradient-primary);\n    -webkit-background-clip: text;\n    -webkit-text-fill-color: transparent;\n    background-clip: text;\n    text-align: center;\n}\n\n.section-description {\n    text-align: center;\n    color: var(--text-secondary);\n    margin-bottom: 25px;\n    font-size: 1.1rem;\n}\n\n/* ====== Feature Section Cards ====== */\n.feature-section-card {\n    background: linear-gradient(135deg, var(--accent-purple) 0%, var(--accent-blue) 100%);\n    border-radius: 16px;\n    padding: 20px;\n    margin: 20px 0;\n    color: white;\n    text-align: center;\n    box-shadow: var(--shadow-lg);\n}\n\n.feature-section-title {\n    margin: 0;\n    font-size: 1.5rem;\n    font-weight: 600;\n}\n\n/* ====== Budget Analyzer Styles ====== */\n.budget-analyzer {\n    margin: 20px 0;\n}\n\n.budget-analyzer h3 {\n    color: var(--text-primary) !important;\n    margin-bottom: 15px;\n}\n\n/* ====== Centered Quick Actions ====== */\n.quick-actions {\n    text-align: center;\n    margin: 30px 0;\n}\n\n.stButton > button {\n    margin: 0 10px;\n}\n\n/* ====== Prediction Section ====== */\n.prediction-section {\n    text-align: center;\n    margin: 40px 0 20px 0;\n}\n\n/* ====== Enhanced Stats Cards ====== */\n.stats-card {\n    background: var(--bg-secondary, #1e293b);\n    border-radius: 16px;\n    padding: 25px;\n    margin: 20px 0;\n    border: 1px solid var(--border-color, #334155);\n    box-shadow: var(--shadow-md);\n    transition: all 0.3s ease;\n}\n\n.stats-card:hover {\n    transform: translateY(-2px);\n    box-shadow: var(--shadow-xl);\n}\n\n.stats-card h3 {\n    color: var(--text-primary);\n    margin-bottom: 20px;\n}\n\n/* ====== Tech Stack Cards ====== */\n.tech-stack-card, .tech-card {\n    background: var(--team-member, var(--bg-secondary));\n    border-radius: 16px;\n    padding: 20px;\n    margin: 12px 0;\n    border: 1px solid var(--border-color);\n    box-shadow: var(--shadow-md);\n    transition: all 0.3s ease;\n    text-align: center;\n    display: flex;\n    flex-direction: column;\n    justify-content: center;\n    align-items: center;\n}\n\n.tech-stack-card:hover, .tech-card:hover {\n    transform: translateY(-3px);\n    box-shadow: 0 8px 25px rgba(139, 92, 246, 0.3);\n}\n\n.tech-icon, .tech-stack-icon {\n    font-size: 2.5rem;\n    margin-bottom: 10px;\n}\n\n.tech-title, .tech-stack-title {\n    font-size: 1.1rem;\n    font-weight: 600;\n    color: var(--text-primary);\n    margin-bottom: 5px;\n}\n\n.tech-description, .tech-stack-description {\n    font-size: 0.9rem;\n    color: var(--text-secondary);\n}\n\n/* ====== Team Member Cards ====== */\n.team-member-card {\n    background: var(--team-member, rgb(247, 247, 248));\n    border-radius: 16px;\n    padding: 25px;\n    text-align: center;\n    transition: all 0.3s ease;\n    box-shadow: var(--shadow-md);\n    margin: 15px 0;\n}\n\n.team-member-card:hover {\n    transform: translateY(-5px);\n    box-shadow: 0 10px 30px rgba(59, 130, 246, 0.4);\n}\n\n.team-member-card:nth-child(1):hover {\n    box-shadow: 0 10px 30px rgba(139, 92, 246, 0.4);\n}\n\n.team-member-card:nth-child(2):hover {\n    box-shadow: 0 10px 30px rgba(59, 130, 246, 0.4);\n}\n\n.team-member-card:nth-child(3):hover {\n    box-shadow: 0 10px 30px rgba(6, 182, 212, 0.4);\n}\n\n/* ====== Hero Description Center Alignment ====== */\n.hero-description {\n    text-align: center;\n    display: inline-flex;\n    justify-content: center;\n    align-items: center;\n    width: 100%;\n}\n\n/* ====== Centered Buttons ====== */\n.stColumn > div {\n    display: flex;\n    justify-content: center;\n}\n\n/* ====== Enhanced Expander Styling ====== */\n.streamlit-expanderHeader {\n    background: linear-gradient(135deg, var(--accent-purple) 0%, var(--accent-blue) 100%);\n    border-radius: 10px;\n    color: white !important;\n    font-weight: 600;\n}\n\n/* ====== Feature Cards Container ====== */\n.feature-cards-container {\n    margin: 30px 0;\n}\n\n/* ====== Enhanced Form Elements ====== */\n.stSelectbox label, .stNumberInput label, .stSlider label {\n    color: var(--text-primary) !important;\n    font-weight: 500;\n}\n\n/* ====== Prediction Results Styling ====== */\n.prediction-results {\n    margin: 30px 0;\n}\n\n.prediction-metric {\n    text-align: center;\n    padding: 20px;\n    background: var(--bg-secondary);\n    border-radius: 12px;\n    margin: 10px;\n    border: 1px solid var(--border-color);\n}\n\n/* ====== Analysis Cards ====== */\n.analysis-card {\n    background: var(--bg-secondary);\n    border-radius: 16px;\n    padding: 25px;\n    margin: 20px 0;\n    border-left: 4px solid var(--accent-blue);\n    box-shadow: var(--shadow-md);\n}\n\n/* ====== Confidence Visualization ====== */\n.confidence-container {\n    margin: 30px 0;\n    text-align: center;\n}\n\n.confidence-bar {\n    width: 100%;\n    height: 20px;\n    background: linear-gradient(90deg, #ef4444 0%, #f59e0b 50%, #10b981 100%);\n    border-radius: 10px;\n    position: relative;\n    margin: 20px 0;\n}\n\n.confidence-indicator {\n    position: absolute;\n    top: -5px;\n    width: 4px;\n    height: 30px;\n    background: white;\n    border-radius: 2px;\n    box-shadow: 0 2px 4px rgba(0,0,0,0.3);\n}\n\n/* ====== Market Comparison Styling ====== */\n.market-comparison {\n    background: var(--bg-secondary);\n    border-radius: 16px;\n    padding: 25px;\n    margin: 20px 0;\n}\n\n/* ====== Feature Importance Graph ====== */\n.feature-importance {\n    margin: 30px 0;\n}\n\n.importance-bar {\n    display: flex;\n    align-items: center;\n    margin: 10px 0;\n    padding: 8px;\n    background: var(--bg-secondary);\n    border-radius: 8px;\n}\n\n.importance-label {\n    width: 150px;\n    font-weight: 500;\n}\n\n.importance-value {\n    flex: 1;\n    height: 8px;\n    background: linear-gradient(90deg, var(--accent-purple), var(--accent-blue));\n    border-radius: 4px;\n    margin: 0 10px;\n}\n\n/* ====== Summary Section ====== */\n.prediction-summary {\n    background: linear-gradient(135deg, var(--accent-purple) 0%, var(--accent-blue) 100%);\n    color: white;\n    border-radius: 16px;\n    padding: 30px;\n    margin: 30px 0;\n    text-align: center;\n}\n\n.summary-title {\n    font-size: 1.8rem;\n    font-weight: 700;\n    margin-bottom: 20px;\n}\n\n.summary-content {\n    font-size: 1.1rem;\n    line-height: 1.6;\n}\n\n/* ====== Responsive Design ====== */\n@media (max-width: 768px) {\n    .hero-stats {\n        grid-template-columns: repeat(2, 1fr);\n        gap: 15px;\n    }\n    \n    .tech-stack-card, .tech-card {\n        height: auto;\n        min-height: 120px;\n    }\n    \n    .section-title {\n        font-size: 1.5rem;\n    }\n    \n    .feature-section-card {\n        padding: 15px;\n    }\n}\n\n.tech-stack-card:hover, .tech-card:hover {\n    transform: translateY(-4px);\n    box-shadow: 0 8px 25px rgba(139, 92, 246, 0.3);\n}\n\n.tech-stack-icon, .tech-icon {\n    font-size: 2.5rem;\n    margin-bottom: 8px;\n}\n\n.tech-stack-title, .tech-title {\n    font-size: 1.1rem;\n    font-weight: 600;\n    margin: 8px 0 4px 0;\n    color: var(--text-primary);\n}\n\n.tech-stack-description, .tech-description {\n    font-size: 0.9rem;\n    color: var(--text-secondary);\n    margin: 0;\n}\n\n[data-theme="dark"] {\n    --team-member: rgb(30, 30, 35);\n}\n\n/* Different hover colors for team members */\n.stats-card:nth-child(1):hover {\n    box-shadow: 0 8px 25px rgba(139, 92, 246, 0.4);\n}\n\n.stats-card:nth-child(2):hover {\n    box-shadow: 0 8px 25px rgba(59, 130, 246, 0.4);\n}\n\n.stats-card:nth-child(3):hover {\n    box-shadow: 0 8px 25px rgba(6, 182, 212, 0.4);\n}\n\n.stats-card:nth-child(4):hover {\n    box-shadow: 0 8px 25px rgba(236, 72, 153, 0.4);\n}\n\n.stats-card:nth-child(5):hover {\n    box-shadow: 0 8px 25px rgba(16, 185, 129, 0.4);\n}\n\n.stats-card:nth-child(6):hover {\n    box-shadow: 0 8px 25px rgba(245, 158, 11, 0.4);\n}\n\n/* Tech stack hover colors */\n.tech-card:nth-child(1):hover {\n    box-shadow: 0 8px 25px rgba(55, 118, 171, 0.4); /* Python blue */\n}\n\n.tech-card:nth-child(2):hover {\n    box-shadow: 0 8px 25px rgba(242, 101, 34, 0.4); /* Scikit-learn orange */\n}\n\n.tech-card:nth-child(3):hover {\n    box-shadow: 0 8px 25px rgba(255, 75, 75, 0.4); /* Streamlit red */\n}\n\n.tech-card:nth-child(4):hover {\n    box-shadow: 0 8px 25px rgba(99, 110, 250, 0.4); /* Plotly blue */\n}\n\n/* Center button styles */\n.stButton > button {\n    width: 100%;\n    justify-content: center;\n}\n\n/* Additional feature dropdown styles */\n.stExpander > div > div > div {\n    background: var(--bg-tertiary);\n    border-radius: 12px;\n}\n\n/* ====== Enhanced Loading States ====== */\n.loading-container {\n    display: flex;\n    flex-direction: column;\n    align-items: center;\n    justify-content: center;\n    padding: var(--space-4xl);\n    text-align: center;\n}\n\n.loading-title {\n    font-size: var(--font-size-xl);\n    font-weight: 600;\n    color: var(--text-primary);\n    margin-bottom: var(--space-lg);\n    animation: fadeInUp 0.8s ease-out;\n}\n\n.loading-description {\n    color: var(--text-secondary);\n    margin-bottom: var(--space-xl);\n    animation: fadeInUp 0.8s ease-out 0.2s both;\n}\n\n/* ====== Pulse Animation for Loading States ====== */\n.pulse {\n    animation: pulse 2s cubic-bezier(0.4, 0, 0.6, 1) infinite;\n}\n\n@keyframes pulse {\n    0%, 100% {\n        opacity: 1;\n    }\n    50% {\n        opacity: 0.5;\n    }\n}\n\n/* ====== Skeleton Loading ====== */\n.skeleton {\n    background: linear-gradient(\n        90deg,\n        var(--bg-tertiary) 25%,\n        var(--bg-secondary) 50%,\n        var(--bg-tertiary) 75%\n    );\n    background-size: 200% 100%;\n    animation: skeletonLoading 1.5s infinite;\n    border-radius: var(--radius-md);\n}\n\n@keyframes skeletonLoading {\n    0% {\n        background-position: 200% 0;\n    }\n    100% {\n        background-position: -200% 0;\n    }\n}\n\n/* ====== Enhanced Hover Effects ====== */\n.hover-lift {\n    transition: all var(--transition-spring);\n}\n\n.hover-lift:hover {\n    transform: translateY(-4px) scale(1.02);\n    box-shadow: var(--shadow-xl);\n}\n\n.hover-glow {\n    position: relative;\n    transition: all var(--transition-normal);\n}\n\n.hover-glow::before {\n    content: \'\';\n    position: absolute;\n    top: 0;\n    left: 0;\n    right: 0;\n    bottom: 0;\n    background: var(--gradient-primary);\n    opacity: 0;\n    filter: blur(20px);\n    z-index: -1;\n    transition: opacity var(--transition-normal);\n    border-radius: inherit;\n}\n\n.hover-glow:hover::before {\n    opacity: 0.3;\n}\n\n/* ====== Scroll Progress Indicator ====== */\n.scroll-progress {\n    position: fixed;\n    top: 0;\n    left: 0;\n    width: 100%;\n    height: 3px;\n    background: var(--gradient-primary);\n    transform-origin: left;\n    transform: scaleX(0);\n    z-index: 9999;\n    transition: transform 0.1s linear;\n}\n\n/* ====== Enhanced Focus States ====== */\n*:focus-visible {\n    outline: 2px solid var(--accent-purple);\n    outline-offset: 2px;\n    border-radius: var(--radius-sm);\n}\n\n/* ====== Print Styles ====== */\n@media print {\n    .modern-navbar,\n    .sidebar-content {\n        display: none !important;\n    }\n    \n    .modern-card,\n    .feature-card {\n        break-inside: avoid;\n        box-shadow: none !important;\n        border: 1px solid #000 !important;\n    }\n}\n\n/* ====== High Contrast Mode ====== */\n@media (prefers-contrast: high) {\n    :root {\n        --text-primary: #000000;\n        --text-secondary: #333333;\n        --bg-primary: #ffffff;\n        --border-color: #000000;\n    }\n    \n    [data-theme="dark"] {\n        --text-primary: #ffffff;\n        --text-secondary: #cccccc;\n        --bg-primary: #000000;\n        --border-color: #ffffff;\n    }\n}\n\n/* ====== Reduced Motion ====== */\n@media (prefers-reduced-motion: reduce) {\n    *,\n    *::before,\n    *::after {\n        animation-duration: 0.01ms !important;\n        animation-iteration-count: 1 !important;\n        transition-duration: 0.01ms !important;\n        scroll-behavior: auto !important;\n    }\n}\n\n/* ====== Typography Classes ====== */\n.modern-title {\n    font-size: var(--font-size-3xl);\n    font-weight: 700;\n    color: var(--text-primary);\n    margin-bottom: var(--space-lg);\n}\n\n.modern-subtitle {\n    font-size: var(--font-size-xl);\n    font-weight: 600;\n    color: var(--text-primary);\n    margin-bottom: var(--space-md);\n}\n\n.modern-text {\n    color: var(--text-secondary);\n    line-height: var(--leading-relaxed);\n}\n\n/* ====== Grid System ====== */\n.container {\n    max-width: 1200px;\n    margin: 0 auto;\n    padding: 0 var(--space-lg);\n}\n\n.grid {\n    display: grid;\n    gap: var(--space-xl);\n}\n\n.grid-1 { grid-template-columns: 1fr; }\n.grid-2 { grid-template-columns: repeat(2, 1fr); }\n.grid-3 { grid-template-columns: repeat(3, 1fr); }\n.grid-4 { grid-template-columns: repeat(4, 1fr); }\n\n@media (max-width: 768px) {\n    .grid-2,\n    .grid-3,\n    .grid-4 {\n        grid-template-columns: 1fr;\n    }\n}\n\n/* ====== Spacing Utilities ====== */\n.mt-xs { margin-top: var(--space-xs); }\n.mt-sm { margin-top: var(--space-sm); }\n.mt-md { margin-top: var(--space-md); }\n.mt-lg { margin-top: var(--space-lg); }\n.mt-xl { margin-top: var(--space-xl); }\n.mt-2xl { margin-top: var(--space-2xl); }\n\n.mb-xs { margin-bottom: var(--space-xs); }\n.mb-sm { margin-bottom: var(--space-sm); }\n.mb-md { margin-bottom: var(--space-md); }\n.mb-lg { margin-bottom: var(--space-lg); }\n.mb-xl { margin-bottom: var(--space-xl); }\n.mb-2xl { margin-bottom: var(--space-2xl); }\n\n/* ====== Sidebar Styles ====== */\n.sidebar-content {\n    background: var(--bg-surface);\n    border-radius: var(--radius-xl);\n    padding: var(--space-lg);\n    margin-bottom: var(--space-lg);\n    border: 1px solid var(--border-light);\n}\n\n.sidebar-logo {\n    display: flex;\n    align-items: center;\n    gap: var(--space-md);\n    margin-bottom: var(--space-xl);\n    padding: var(--space-lg);\n    background: var(--gradient-primary);\n    border-radius: var(--radius-xl);\n    color: white;\n}\n\n.sidebar-logo-icon {\n    width: 40px;\n    height: 40px;\n    background: rgba(255, 255, 255, 0.2);\n    border-radius: var(--radius-lg);\n    display: flex;\n    align-items: center;\n    justify-content: center;\n    font-size: var(--font-size-xl);\n    animation: logoFloat 6s ease-in-out infinite;\n}\n\n.sidebar-title {\n    font-size: var(--font-size-lg);\n    font-weight: 700;\n    margin: 0;\n}\n\n.sidebar-section {\n    margin: var(--space-lg) 0;\n}\n\n.sidebar-section-title {\n    font-size: var(--font-size-md);\n    font-weight: 600;\n    color: var(--text-primary);\n    margin-bottom: var(--space-md);\n    display: flex;\n    align-items: center;\n    gap: var(--space-sm);\n}\n\n.sidebar-stats {\n    display: flex;\n    flex-direction: column;\n    gap: var(--space-md);\n}\n\n.stat-card {\n    display: flex;\n    align-items: center;\n    gap: var(--space-md);\n    padding: var(--space-md);\n    background: rgba(139, 92, 246, 0.05);\n    border: 1px solid rgba(139, 92, 246, 0.1);\n    border-radius: var(--radius-lg);\n    transition: all var(--transition-normal);\n}\n\n.stat-card:hover {\n    background: rgba(139, 92, 246, 0.1);\n    border-color: rgba(139, 92, 246, 0.2);\n    transform: translateX(4px);\n}\n\n.stat-icon {\n    width: 32px;\n    height: 32px;\n    background: var(--gradient-primary);\n    border-radius: var(--radius-md);\n    display: flex;\n    align-items: center;\n    justify-content: center;\n    font-size: var(--font-size-sm);\n}\n\n.stat-info {\n    flex: 1;\n}\n\n.stat-value {\n    font-size: var(--font-size-lg);\n    font-weight: 700;\n    color: var(--text-primary);\n    line-height: 1;\n}\n\n.stat-name {\n    font-size: var(--font-size-xs);\n    color: var(--text-secondary);\n    font-weight: 500;\n}\n\n/* ====== Enhanced Dark Theme Support ====== */\n[data-theme="dark"] {\n    color-scheme: dark;\n}\n\n[data-theme="dark"] .sidebar-logo {\n    background: var(--gradient-secondary);\n}\n\n[data-theme="dark"] .stat-card {\n    background: rgba(139, 92, 246, 0.08);\n    border-color: rgba(139, 92, 246, 0.15);\n}\n\n[data-theme="dark"] .stat-card:hover {\n    background: rgba(139, 92, 246, 0.15);\n    border-color: rgba(139, 92, 246, 0.25);\n}\n\n/* ====== Responsive Breakpoints ====== */\n@media (max-width: 1200px) {\n    .nav-container {\n        padding: 0 var(--space-lg);\n    }\n    \n    .hero-container {\n        padding: var(--space-3xl) var(--space-md);\n    }\n}\n\n@media (max-width: 768px) {\n    .hero-title {\n        font-size: clamp(2rem, 8vw, 3rem);\n    }\n    \n    .hero-description {\n        font-size: var(--font-size-lg);\n    }\n    \n    .hero-stats {\n        gap: var(--space-lg);\n    }\n    \n    .nav-container {\n        height: 60px;\n        padding: 0 var(--space-md);\n    }\n    \n    .nav-logo-icon {\n        width: 40px;\n        height: 40px;\n    }\n    \n    .nav-links {\n        display: none;\n    }\n    \n    .feature-cards-container {\n        grid-template-columns: 1fr;\n        gap: var(--space-lg);\n    }\n}\n\n@media (max-width: 480px) {\n    .hero-container {\n        padding: var(--space-2xl) var(--space-sm);\n    }\n    \n    .hero-stats {\n        flex-direction: column;\n        gap: var(--space-md);\n    }\n    \n    .modern-card,\n    .feature-card {\n        padding: var(--space-lg);\n    }\n}\n\n/* ====== Propalytic Form Styling ====== */\n.stSelectbox > div > div {\n    background: rgba(255, 255, 255, 0.9) !important;\n    backdrop-filter: blur(20px) !important;\n    border: 2px solid var(--border-light) !important;\n    border-radius: var(--radius-xl) !important;\n    transition: all var(--transition-normal) !important;\n    box-shadow: var(--shadow-sm) !important;\n}\n\n.stSelectbox > div > div:hover {\n    border-color: var(--accent-purple) !important;\n    box-shadow: var(--shadow-md) !important;\n    transform: translateY(-1px) !important;\n}\n\n.stSelectbox > div > div:focus-within {\n    border-color: var(--accent-purple) !important;\n    box-shadow: 0 0 0 3px rgba(139, 92, 246, 0.1) !important;\n}\n\n.stNumberInput > div > div > input {\n    background: rgba(255, 255, 255, 0.9) !important;\n    backdrop-filter: blur(20px) !important;\n    border: 2px solid var(--border-light) !important;\n    border-radius: var(--radius-xl) !important;\n    padding: var(--space-md) var(--space-lg) !important;\n    transition: all var(--transition-normal) !important;\n    font-weight: 500 !important;\n}\n\n.stNumberInput > div > div > input:hover {\n    border-color: var(--accent-purple) !important;\n    box-shadow: var(--shadow-md) !important;\n    transform: translateY(-1px) !important;\n}\n\n.stNumberInput > div > div > input:focus {\n    border-color: var(--accent-purple) !important;\n    box-shadow: 0 0 0 3px rgba(139, 92, 246, 0.1) !important;\n    outline: none !important;\n}\n\n/* ====== Enhanced Button Styling ====== */\n.stButton > button {\n    background: var(--gradient-primary) !important;\n    border: none !important;\n    border-radius: var(--radius-xl) !important;\n    padding: var(--space-lg) var(--space-2xl) !important;\n    font-weight: 600 !important;\n    font-size: var(--font-size-lg) !important;\n    color: white !important;\n    transition: all var(--transition-spring) !important;\n    position: relative !important;\n    overflow: hidden !important;\n    box-shadow: var(--shadow-lg) !important;\n    text-transform: none !important;\n    letter-spacing: 0.5px !important;\n}\n\n.stButton > button::before {\n    content: \'\' !important;\n    position: absolute !important;\n    top: 0 !important;\n    left: -100% !important;\n    width: 100% !important;\n    height: 100% !important;\n    background: linear-gradient(90deg, transparent, rgba(255,255,255,0.3), transparent) !important;\n    transition: all 0.6s ease !important;\n}\n\n.stButton > button:hover {\n    transform: translateY(-3px) scale(1.02) !important;\n    box-shadow: var(--shadow-xl) !important;\n}\n\n.stButton > button:hover::before {\n    left: 100% !important;\n}\n\n.stButton > button:active {\n    transform: translateY(-1px) scale(0.98) !important;\n}\n\n/* ====== Enhanced Metrics ====== */\n.metric-container {\n    background: rgba(255, 255, 255, 0.9);\n    backdrop-filter: blur(20px);\n    border: 2px solid var(--border-light);\n    border-radius: var(--radius-2xl);\n    padding: var(--space-xl);\n    text-align: center;\n    transition: all var(--transition-spring);\n    position: relative;\n    overflow: hidden;\n}\n\n.metric-container::before {\n    content: \'\';\n    position: absolute;\n    top: 0;\n    left: 0;\n    right: 0;\n    height: 3px;\n    background: var(--gradient-primary);\n    transform: translateX(-100%);\n    transition: transform var(--transition-slow);\n}\n\n.metric-container:hover {\n    transform: translateY(-8px) scale(1.02);\n    box-shadow: var(--shadow-xl);\n    border-color: var(--accent-purple);\n}\n\n.metric-container:hover::before {\n    transform: translateX(0);\n}\n\n/* ====== Loading Animations ====== */\n.loading-spinner {\n    display: inline-block;\n    width: 40px;\n    height: 40px;\n    border: 3px solid rgba(139, 92, 246, 0.3);\n    border-radius: 50%;\n    border-top-color: var(--accent-purple);\n    animation: spin 1s ease-in-out infinite;\n}\n\n@keyframes spin {\n    to { transform: rotate(360deg); }\n}\n\n.loading-dots {\n    display: inline-flex;\n    gap: var(--space-xs);\n}\n\n.loading-dot {\n    width: 8px;\n    height: 8px;\n    border-radius: 50%;\n    background: var(--accent-purple);\n    animation: dotPulse 1.4s ease-in-out infinite both;\n}\n\n.loading-dot:nth-child(1) { animation-delay: -0.32s; }\n.loading-dot:nth-child(2) { animation-delay: -0.16s; }\n\n@keyframes dotPulse {\n    0%, 80%, 100% {\n        transform: scale(0);\n        opacity: 0.5;\n    }\n    40% {\n        transform: scale(1);\n        opacity: 1;\n    }\n}\n\n/* ====== Card Variants ====== */\n.card-primary {\n    border-left: 4px solid var(--accent-purple);\n}\n\n.card-secondary {\n    border-left: 4px solid var(--accent-blue);\n}\n\n.card-success {\n    border-left: 4px solid var(--accent-green);\n}\n\n.card-warning {\n    border-left: 4px solid var(--accent-orange);\n}\n\n.card-error {\n    border-left: 4px solid var(--accent-pink);\n}\n\n/* ====== Dark Theme Form Overrides ====== */\n[data-theme="dark"] .stSelectbox > div > div {\n    background: rgba(15, 23, 42, 0.9) !important;\n}\n\n[data-theme="dark"] .stNumberInput > div > div > input {\n    background: rgba(15, 23, 42, 0.9) !important;\n    color: var(--text-primary) !important;\n}\n\n[data-theme="dark"] .metric-container {\n    background: rgba(15, 23, 42, 0.9);\n}\n\n/* ====== StreamLit Option Menu Propalytic Styling ====== */\n\n/* Option Menu Container */\ndiv[data-testid="stHorizontalBlock"] .stOptionMenu {\n    position: fixed !important;\n    top: 15px !important;\n    left: 50% !important;\n    transform: translateX(-50%) !important;\n    z-index: var(--z-navbar) !important;\n    background: rgba(248, 250, 252, 0.95) !important;\n    backdrop-filter: blur(24px) saturate(180%) !important;\n    border: 1px solid var(--border-light) !important;\n    border-radius: var(--radius-2xl) !important;\n    padding: var(--space-sm) !important;\n    box-shadow: var(--shadow-xl) !important;\n    max-width: 90vw !important;\n    overflow-x: auto !important;\n}\n\n[data-theme="dark"] div[data-testid="stHorizontalBlock"] .stOptionMenu {\n    background: rgba(15, 23, 42, 0.95) !important;\n    border-color: rgba(51, 65, 85, 0.5) !important;\n    box-shadow: var(--shadow-xl) !important;\n}\n\n/* Option Menu Navigation Links */\n.stOptionMenu .nav-link {\n    font-weight: 500 !important;\n    font-size: var(--font-size-sm) !important;\n    padding: var(--space-md) var(--space-lg) !important;\n    border-radius: var(--radius-xl) !important;\n    margin: 0 var(--space-xs) !important;\n    transition: all var(--transition-spring) !important;\n    position: relative !important;\n    overflow: hidden !important;\n    color: var(--text-secondary) !important;\n    background: transparent !important;\n    border: 1px solid transparent !important;\n}\n\n.stOptionMenu .nav-link::before {\n    content: \'\';\n    position: absolute;\n    top: 0;\n    left: 0;\n    width: 100%;\n    height: 100%;\n    background: var(--gradient-primary);\n    opacity: 0;\n    transition: all var(--transition-normal);\n    z-index: -1;\n    border-radius: var(--radius-xl);\n    transform: scale(0.8);\n}\n\n.stOptionMenu .nav-link:hover {\n    color: white !important;\n    transform: translateY(-2px) scale(1.05) !important;\n    box-shadow: var(--shadow-lg) !important;\n    border-color: var(--accent-purple) !important;\n}\n\n.stOptionMenu .nav-link:hover::before {\n    opacity: 1 !important;\n    transform: scale(1) !important;\n}\n\n.stOptionMenu .nav-link-selected {\n    background: var(--gradient-primary) !important;\n    color: white !important;\n    transform: translateY(-1px) !important;\n    box-shadow: var(--shadow-glow) !important;\n    border-color: transparent !important;\n}\n\n.stOptionMenu .nav-link-selected::before {\n    opacity: 0 !important;\n}\n\n/* Option Menu Icons */\n.stOptionMenu .nav-link i {\n    margin-right: var(--space-sm) !important;\n    font-size: var(--font-size-lg) !important;\n    transition: all var(--transition-normal) !important;\n}\n\n.stOptionMenu .nav-link:hover i,\n.stOptionMenu .nav-link-selected i {\n    transform: scale(1.1) rotate(5deg) !important;\n}\n\n/* Main content padding adjustment for fixed navbar */\n.main .block-container {\n    padding-top: 120px !important;\n}\n\n@media (max-width: 768px) {\n    div[data-testid="stHorizontalBlock"] .stOptionMenu {\n        position: relative !important;\n        top: 0 !important;\n        left: 0 !important;\n        transform: none !important;\n        margin: var(--space-md) 0 !important;\n        width: 100% !important;\n    }\n    \n    .main .block-container {\n        padding-top: var(--space-xl) !important;\n    }\n    \n    .stOptionMenu .nav-link {\n        font-size: var(--font-size-xs) !important;\n        padding: var(--space-sm) var(--space-md) !important;\n    }\n}\n\n/* ====== Enhanced Navbar Logo Styling ====== */\n.navbar-logo {\n    display: flex !important;\n    align-items: center !important;\n    gap: var(--space-sm) !important;\n    margin-right: var(--space-lg) !important;\n    font-weight: 700 !important;\n    font-size: var(--font-size-lg) !important;\n    color: var(--text-primary) !important;\n    text-decoration: none !important;\n    padding: var(--space-sm) !important;\n}\n\n.navbar-logo-icon {\n    width: 40px !important;\n    height: 40px !important;\n    background: var(--gradient-primary) !important;\n    border-radius: var(--radius-lg) !important;\n    display: flex !important;\n    align-items: center !important;\n    justify-content: center !important;\n    font-size: var(--font-size-xl) !important;\n    animation: logoFloat 6s ease-in-out infinite !important;\n    box-shadow: var(--shadow-lg) !important;\n    position: relative !important;\n    overflow: hidden !important;\n}\n\n.navbar-logo-icon::before {\n    content: \'\' !important;\n    position: absolute !important;\n    top: 0 !important;\n    left: -100% !important;\n    width: 100% !important;\n    height: 100% !important;\n    background: linear-gradient(90deg, transparent, rgba(255,255,255,0.3), transparent) !important;\n    transition: all 0.6s ease !important;\n}\n\n.navbar-logo:hover .navbar-logo-icon::before {\n    left: 100% !important;\n}\n\n@keyframes logoFloat {\n    0%, 100% { \n        transform: translateY(0px) rotate(0deg);\n        box-shadow: var(--shadow-lg);\n    }\n    50% { \n        transform: translateY(-3px) rotate(180deg);\n        box-shadow: var(--shadow-xl);\n    }\n}\n\n/* ====== Theme Toggle Button in Navbar ====== */\n.theme-toggle-btn {\n    background: rgba(139, 92, 246, 0.1) !important;\n    border: 1px solid rgba(139, 92, 246, 0.2) !important;\n    border-radius: var(--radius-lg) !important;\n    padding: var(--space-sm) var(--space-md) !important;\n    cursor: pointer !important;\n    transition: all var(--transition-normal) !important;\n    margin-left: var(--space-lg) !important;\n    font-size: var(--font-size-lg) !important;\n    color: var(--text-primary) !important;\n}\n\n.theme-toggle-btn:hover {\n    background: rgba(139, 92, 246, 0.2) !important;\n    transform: scale(1.05) !important;\n    box-shadow: var(--shadow-md) !important;\n}\n\n/* ====== Streamlit Option Menu Overrides ====== */\n/* Hide default streamlit option menu styling */\n.stOptionMenu > div {\n    border: none !important;\n    background: transparent !important;\n    box-shadow: none !important;\n}\n\n/* Style the actual menu container */\n.stOptionMenu nav {\n    background: transparent !important;\n    border: none !important;\n    padding: 0 !important;\n}\n\n/* Individual menu items */\n.stOptionMenu nav > ul {\n    display: flex !important;\n    flex-wrap: wrap !important;\n    gap: var(--space-xs) !important;\n    padding: 0 !important;\n    margin: 0 !important;\n    list-style: none !important;\n}\n\n.stOptionMenu nav > ul > li {\n    display: flex !important;\n}\n\n.stOptionMenu nav > ul > li > a {\n    font-weight: 500 !important;\n    font-size: var(--font-size-sm) !important;\n    padding: var(--space-md) var(--space-lg) !important;\n    border-radius: var(--radius-xl) !important;\n    margin: 0 !important;\n    transition: all var(--transition-spring) !important;\n    position: relative !important;\n    overflow: hidden !important;\n    color: var(--text-secondary) !important;\n    background: transparent !important;\n    border: 1px solid transparent !important;\n    text-decoration: none !important;\n    display: flex !important;\n    align-items: center !important;\n    gap: var(--space-sm) !important;\n}\n\n.stOptionMenu nav > ul > li > a::before {\n    content: \'\';\n    position: absolute;\n    top: 0;\n    left: 0;\n    width: 100%;\n    height: 100%;\n    background: var(--gradient-primary);\n    opacity: 0;\n    transition: all var(--transition-normal);\n    z-index: -1;\n    border-radius: var(--radius-xl);\n    transform: scale(0.8);\n}\n\n.stOptionMenu nav > ul > li > a:hover {\n    color: white !important;\n    transform: translateY(-2px) scale(1.05) !important;\n    box-shadow: var(--shadow-lg) !important;\n    border-color: var(--accent-purple) !important;\n}\n\n.stOptionMenu nav > ul > li > a:hover::before {\n    opacity: 1 !important;\n    transform: scale(1) !important;\n}\n\n.stOptionMenu nav > ul > li > a.nav-link-selected {\n    background: var(--gradient-primary) !important;\n    color: white !important;\n    transform: translateY(-1px) !important;\n    box-shadow: var(--shadow-glow) !important;\n    border-color: transparent !important;\n}\n\n.stOptionMenu nav > ul > li > a.nav-link-selected::before {\n    opacity: 0 !important;\n}\n\n/* ====== Propalytic Enhanced Components ====== */\n\n/* Quick Actions Section */\n.quick-actions {\n    padding: 2rem 0;\n    text-align: center;\n    background: linear-gradient(135deg, var(--bg-color1), var(--bg-color2));\n    border-radius: var(--border-radius-lg);\n    margin: 2rem 0;\n    border: 1px solid var(--border-color);\n    position: relative;\n    overflow: hidden;\n}\n\n.quick-actions::before {\n    content: \'\';\n    position: absolute;\n    top: 0;\n    left: 0;\n    right: 0;\n    bottom: 0;\n    background: var(--gradient-primary);\n    opacity: 0.05;\n    z-index: 0;\n}\n\n.quick-actions .section-title {\n    position: relative;\n    z-index: 1;\n    margin-bottom: 1rem;\n}\n\n/* Budget Analyzer Section */\n.budget-analyzer {\n    background: rgba(255, 255, 255, 0.9);\n    backdrop-filter: blur(20px);\n    border: 2px solid var(--border-light);\n    border-radius: var(--radius-2xl);\n    padding: var(--space-xl);\n    margin: var(--space-xl) 0;\n    box-shadow: var(--shadow-lg);\n}\n\n[data-theme="dark"] .budget-analyzer {\n    background: rgba(15, 23, 42, 0.9);\n    color: var(--text-primary);\n}\n\n.budget-analyzer h3 {\n    color: var(--text-primary) !important;\n    font-weight: 600;\n    margin-bottom: var(--space-lg);\n}\n\n.section-title {\n    font-size: var(--font-size-2xl);\n    font-weight: 700;\n    color: var(--text-primary);\n    text-align: center;\n    margin: var(--space-xl) 0;\n    background: var(--gradient-primary);\n    background-clip: text;\n    -webkit-background-clip: text;\n    -webkit-text-fill-color: transparent;\n}\n\n.section-subtitle {\n    font-size: var(--font-size-xl);\n    font-weight: 600;\n    color: var(--text-primary) !important;\n    margin-bottom: var(--space-lg);\n}\n\n.section-description {\n    color: var(--text-secondary);\n    text-align: center;\n    margin-bottom: var(--space-xl);\n    font-size: var(--font-size-lg);\n}\n\n/* ====== Feature Cards Styling ====== */\n.feature-section-card {\n    background: rgba(255, 255, 255, 0.9);\n    backdrop-filter: blur(20px);\n    border: 2px solid var(--border-light);\n    border-radius: var(--radius-2xl);\n    padding: var(--space-xl);\n    margin: var(--space-lg) 0;\n    box-shadow: var(--shadow-lg);\n    transition: all var(--transition-spring);\n}\n\n[data-theme="dark"] .feature-section-card {\n    background: rgba(15, 23, 42, 0.9);\n}\n\n.feature-section-card:hover {\n    transform: translateY(-4px);\n    box-shadow: var(--shadow-xl);\n    border-color: var(--accent-purple);\n}\n\n.feature-section-header {\n    display: flex;\n    justify-content: space-between;\n    align-items: center;\n    margin-bottom: var(--space-lg);\n}\n\n.feature-section-title {\n    font-size: var(--font-size-xl);\n    font-weight: 600;\n    margin: 0;\n    color: var(--text-primary);\n}\n\n/* Prediction Section */\n.prediction-section {\n    background: rgba(255, 255, 255, 0.95);\n    backdrop-filter: blur(24px);\n    border: 2px solid var(--border-light);\n    border-radius: var(--radius-2xl);\n    padding: var(--space-xl);\n    margin: var(--space-xl) 0;\n    box-shadow: var(--shadow-xl);\n}\n\n[data-theme="dark"] .prediction-section {\n    background: rgba(15, 23, 42, 0.95);\n}\n\n.prediction-section-title {\n    font-size: var(--font-size-xl);\n    font-weight: 700;\n    color: var(--text-primary);\n    margin-bottom: var(--space-lg);\n    text-align: center;\n    background: var(--gradient-primary);\n    background-clip: text;\n    -webkit-background-clip: text;\n    -webkit-text-fill-color: transparent;\n}\n\n.prediction-grid {\n    display: grid;\n    grid-template-columns: repeat(auto-fit, minmax(250px, 1fr));\n    gap: var(--space-lg);\n    margin: var(--space-lg) 0;\n}\n\n.prediction-metric-card {\n    background: linear-gradient(135deg, rgba(139, 92, 246, 0.05), rgba(59, 130, 246, 0.05));\n    border: 1px solid rgba(139, 92, 246, 0.2);\n    border-radius: var(--radius-xl);\n    padding: var(--space-lg);\n    text-align: center;\n    transition: all var(--transition-normal);\n}\n\n.prediction-metric-card:hover {\n    transform: translateY(-4px);\n    box-shadow: var(--shadow-lg);\n    background: linear-gradient(135deg, rgba(139, 92, 246, 0.1), rgba(59, 130, 246, 0.1));\n}\n\n/* ====== Model Success Message ====== */\n.model-success-container {\n    background: linear-gradient(135deg, rgb(16, 185, 129) 0%, rgb(5, 150, 105) 100%);\n    color: white;\n    padding: 15px 30px;\n    border-radius: 12px;\n    text-align: center;\n    font-weight: 600;\n    font-size: 1.1rem;\n    margin: 20px 0;\n    width: 100%;\n    min-height: 100%;\n    display: flex;\n    align-items: center;\n    justify-content: center;\n    box-shadow: 0 4px 15px rgba(16, 185, 129, 0.3);\n}'
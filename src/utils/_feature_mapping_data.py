@@ -0,0 +1,89 @@
+"""
+Feature records for the House Price Prediction App
+
+Generated by tools/gen_feature_mapping.py from data/ames_schema.csv - do not edit by hand.
+Each row is (column, friendly name, short tooltip, detailed description, category).
+"""
+
+FEATURE_ROWS = (
+    ('MSSubClass', 'Building Class', 'The building class identifies the type of dwelling involved in the sale', 'Identifies the type of dwelling involved in the sale (20: 1-Story 1946 & newer, 30: 1-Story 1945 & older, 40: 1-Story w/finished attic, 45: 1.5-Story unfinished, 50: 1.5-Story finished, 60: 2-Story 1946 & newer, 70: 2-Story 1945 & older, 75: 2.5-Story all ages, 80: Split or multi-level, 85: Split foyer, 90: Duplex, 120: 1-Story PUD, 150: 1.5-Story PUD, 160: 2-Story PUD, 180: PUD multilevel, 190: 2-Family conversion)', 'Basic Property Info'),
+    ('MSZoning', 'Zoning Classification', 'General zoning classification of the sale', 'Identifies the general zoning classification of the sale', 'Basic Property Info'),
+    ('LotFrontage', 'Street Frontage (feet)', None, 'Linear feet of street connected to property', 'Basic Property Info'),
+    ('LotArea', 'Lot Size (sq ft)', None, 'Lot size in square feet', 'Basic Property Info'),
+    ('Street', 'Road Type', None, 'Type of road access to property', 'Basic Property Info'),
+    ('Alley', 'Alley Access', None, 'Type of alley access to property', 'Basic Property Info'),
+    ('LotShape', 'Lot Shape', None, 'General shape of property', 'Basic Property Info'),
+    ('LandContour', 'Property Flatness', None, 'Flatness of the property', 'Basic Property Info'),
+    ('Utilities', 'Available Utilities', None, 'Type of utilities available', 'Basic Property Info'),
+    ('LotConfig', 'Lot Configuration', None, 'Lot configuration', 'Basic Property Info'),
+    ('LandSlope', 'Land Slope', None, 'Slope of property', 'Basic Property Info'),
+    ('Neighborhood', 'Neighborhood', 'Physical locations within city limits', 'Physical locations within Ames city limits', 'Basic Property Info'),
+    ('Condition1', 'Proximity to Main Road', None, 'Proximity to various conditions (arterial street, railroad, park, etc.)', None),
+    ('Condition2', 'Secondary Proximity', None, 'Proximity to various conditions (if more than one is present)', None),
+    ('BldgType', 'Building Type', 'Type of dwelling', 'Type of dwelling', 'Building Details'),
+    ('HouseStyle', 'House Style', 'Style of dwelling', 'Style of dwelling', 'Building Details'),
+    ('OverallQual', 'Overall Quality (1-10)', 'Overall material and finish quality (1-10 scale)', 'Rates the overall material and finish of the house (1: Very Poor, 2: Poor, 3: Fair, 4: Below Average, 5: Average, 6: Above Average, 7: Good, 8: Very Good, 9: Excellent, 10: Very Excellent)', 'Building Details'),
+    ('OverallCond', 'Overall Condition (1-10)', 'Overall condition rating (1-10 scale)', 'Rates the overall condition of the house (1: Very Poor, 2: Poor, 3: Fair, 4: Below Average, 5: Average, 6: Above Average, 7: Good, 8: Very Good, 9: Excellent, 10: Very Excellent)', 'Building Details'),
+    ('YearBuilt', 'Year Built', 'Original construction date', 'Original construction date', 'Building Details'),
+    ('YearRemodAdd', 'Year Renovated', 'Remodel date (same as construction date if no remodeling)', 'Remodel date (same as construction date if no remodeling or additions)', 'Building Details'),
+    ('RoofStyle', 'Roof Style', 'Type of roof', 'Type of roof', 'Exterior Features'),
+    ('RoofMatl', 'Roof Material', None, 'Roof material', 'Exterior Features'),
+    ('Exterior1st', 'Primary Exterior Material', None, 'Exterior covering on house', 'Exterior Features'),
+    ('Exterior2nd', 'Secondary Exterior Material', None, 'Exterior covering on house (if more than one material)', 'Exterior Features'),
+    ('MasVnrType', 'Masonry Veneer Type', None, 'Masonry veneer type', 'Exterior Features'),
+    ('MasVnrArea', 'Masonry Veneer Area (sq ft)', None, 'Masonry veneer area in square feet', 'Exterior Features'),
+    ('ExterQual', 'Exterior Quality', None, 'Evaluates the quality of the material on the exterior', 'Exterior Features'),
+    ('ExterCond', 'Exterior Condition', None, 'Evaluates the present condition of the material on the exterior', 'Exterior Features'),
+    ('Foundation', 'Foundation Type', 'Type of foundation', 'Type of foundation', 'Exterior Features'),
+    ('BsmtQual', 'Basement Quality', 'Height of the basement', 'Evaluates the height of the basement', 'Basement Features'),
+    ('BsmtCond', 'Basement Condition', 'General condition of the basement', 'Evaluates the general condition of the basement', 'Basement Features'),
+    ('BsmtExposure', 'Basement Exposure', 'Walkout or garden level basement walls', 'Refers to walkout or garden level walls', 'Basement Features'),
+    ('BsmtFinType1', 'Basement Finish Type 1', None, 'Rating of basement finished area', 'Basement Features'),
+    ('BsmtFinSF1', 'Basement Finished Area 1 (sq ft)', None, 'Type 1 finished square feet', 'Basement Features'),
+    ('BsmtFinType2', 'Basement Finish Type 2', None, 'Rating of basement finished area (if multiple types)', 'Basement Features'),
+    ('BsmtFinSF2', 'Basement Finished Area 2 (sq ft)', None, 'Type 2 finished square feet', 'Basement Features'),
+    ('BsmtUnfSF', 'Basement Unfinished Area (sq ft)', None, 'Unfinished square feet of basement area', 'Basement Features'),
+    ('TotalBsmtSF', 'Total Basement Area (sq ft)', None, 'Total square feet of basement area', 'Basement Features'),
+    ('Heating', 'Heating Type', None, 'Type of heating', 'Heating & Electrical'),
+    ('HeatingQC', 'Heating Quality', 'Heating quality and condition', 'Heating quality and condition', 'Heating & Electrical'),
+    ('CentralAir', 'Central Air Conditioning', 'Central air conditioning', 'Central air conditioning', 'Heating & Electrical'),
+    ('Electrical', 'Electrical System', 'Electrical system', 'Electrical system', 'Heating & Electrical'),
+    ('1stFlrSF', 'First Floor Area (sq ft)', 'First Floor square feet', 'First Floor square feet', 'Living Areas'),
+    ('2ndFlrSF', 'Second Floor Area (sq ft)', None, 'Second floor square feet', 'Living Areas'),
+    ('LowQualFinSF', 'Low Quality Finished Area (sq ft)', None, 'Low quality finished square feet (all floors)', 'Living Areas'),
+    ('GrLivArea', 'Above Ground Living Area (sq ft)', 'Above grade (ground) living area square feet', 'Above grade (ground) living area square feet', 'Living Areas'),
+    ('BsmtFullBath', 'Basement Full Bathrooms', 'Basement full bathrooms', 'Basement full bathrooms', 'Rooms & Bathrooms'),
+    ('BsmtHalfBath', 'Basement Half Bathrooms', None, 'Basement half bathrooms', 'Rooms & Bathrooms'),
+    ('FullBath', 'Full Bathrooms Above Ground', None, 'Full bathrooms above grade', 'Rooms & Bathrooms'),
+    ('HalfBath', 'Half Bathrooms Above Ground', None, 'Half baths above grade', 'Rooms & Bathrooms'),
+    ('BedroomAbvGr', 'Bedrooms Above Ground', None, 'Bedrooms above grade (does NOT include basement bedrooms)', 'Rooms & Bathrooms'),
+    ('KitchenAbvGr', 'Kitchens Above Ground', None, 'Kitchens above grade', 'Rooms & Bathrooms'),
+    ('KitchenQual', 'Kitchen Quality', 'Kitchen quality', 'Kitchen quality', 'Rooms & Bathrooms'),
+    ('TotRmsAbvGrd', 'Total Rooms Above Ground', None, 'Total rooms above grade (does not include bathrooms)', 'Rooms & Bathrooms'),
+    ('Functional', 'Home Functionality', None, 'Home functionality (Assume typical unless deductions are warranted)', 'Rooms & Bathrooms'),
+    ('Fireplaces', 'Number of Fireplaces', 'Number of fireplaces', 'Number of fireplaces', 'Additional Features'),
+    ('FireplaceQu', 'Fireplace Quality', 'Fireplace quality', 'Fireplace quality', 'Additional Features'),
+    ('GarageType', 'Garage Type', 'Garage location', 'Garage location', 'Garage Features'),
+    ('GarageYrBlt', 'Garage Year Built', None, 'Year garage was built', 'Garage Features'),
+    ('GarageFinish', 'Garage Finish', 'Interior finish of the garage', 'Interior finish of the garage', 'Garage Features'),
+    ('GarageCars', 'Garage Car Capacity', 'Size of garage in car capacity', 'Size of garage in car capacity', 'Garage Features'),
+    ('GarageArea', 'Garage Area (sq ft)', None, 'Size of garage in square feet', 'Garage Features'),
+    ('GarageQual', 'Garage Quality', None, 'Garage quality', 'Garage Features'),
+    ('GarageCond', 'Garage Condition', None, 'Garage condition', 'Garage Features'),
+    ('PavedDrive', 'Paved Driveway', 'Paved driveway', 'Paved driveway', 'Garage Features'),
+    ('WoodDeckSF', 'Wood Deck Area (sq ft)', None, 'Wood deck area in square feet', 'Outdoor Features'),
+    ('OpenPorchSF', 'Open Porch Area (sq ft)', None, 'Open porch area in square feet', 'Outdoor Features'),
+    ('EnclosedPorch', 'Enclosed Porch Area (sq ft)', None, 'Enclosed porch area in square feet', 'Outdoor Features'),
+    ('3SsnPorch', 'Three Season Porch Area (sq ft)', None, 'Three season porch area in square feet', 'Outdoor Features'),
+    ('ScreenPorch', 'Screen Porch Area (sq ft)', None, 'Screen porch area in square feet', 'Outdoor Features'),
+    ('PoolArea', 'Pool Area (sq ft)', None, 'Pool area in square feet', 'Outdoor Features'),
+    ('PoolQC', 'Pool Quality', None, 'Pool quality', 'Outdoor Features'),
+    ('Fence', 'Fence Quality', None, 'Fence quality', 'Outdoor Features'),
+    ('MiscFeature', 'Miscellaneous Feature', None, 'Miscellaneous feature not covered in other categories', 'Outdoor Features'),
+    ('MiscVal', 'Miscellaneous Feature Value ($)', None, '$Value of miscellaneous feature', 'Outdoor Features'),
+    ('MoSold', 'Month Sold', None, 'Month Sold (MM)', 'Sale Information'),
+    ('YrSold', 'Year Sold', None, 'Year Sold (YYYY)', 'Sale Information'),
+    ('SaleType', 'Sale Type', None, 'Type of sale', 'Sale Information'),
+    ('SaleCondition', 'Sale Condition', 'Condition of sale', 'Condition of sale', 'Sale Information'),
+    ('SalePrice', 'Sale Price ($)', None, 'Sale price in dollars', None),
+)
@@ -0,0 +1,27 @@
+"""
+Compiled range check for validating many input rows at once
+"""
+
+import numpy as np
+
+try:
+    from numba import njit, prange
+except ImportError:  # numba is optional; utils.validate_batch falls back to NumPy
+    njit = None
+
+
+if njit is not None:
+    # Compiled eagerly for the one signature used so the first request does not pay
+    # the JIT cost; no fastmath, which would let NaN (missing) values compare as out of range
+    @njit('boolean[:, ::1](float64[:, ::1], float64[::1], float64[::1])', cache=True, parallel=True)
+    def range_mask(vals, lo, hi):
+        """Flag values outside [lo, hi] column-wise"""
+        n, m = vals.shape
+        out = np.empty((n, m), np.bool_)
+        for i in prange(n):
+            for j in range(m):
+                v = vals[i, j]
+                out[i, j] = v < lo[j] or v > hi[j]
+        return out
+else:
+    range_mask = None
@@ -5,14 +5,20 @@ Data processing utilities for the House Price Prediction App
 import pandas as pd
 import numpy as np
 import streamlit as st
+import os
 from typing import Dict, List, Tuple, Optional
 
 
+@st.cache_data(show_spinner=False)
+def _read_dataset(file_path: str, mtime: float) -> pd.DataFrame:
+    """Read a CSV file; cached per path and modification time"""
+    return pd.read_csv(file_path)
+
+
 def load_dataset(file_path: str) -> pd.DataFrame:
     """Load dataset from CSV file"""
     try:
-        df = pd.read_csv(file_path)
-        return df
+        return _read_dataset(file_path, os.path.getmtime(file_path))
     except Exception as e:
         st.error(f"Error loading dataset: {e}")
         return pd.DataFrame()
@@ -41,55 +47,72 @@ def preprocess_features(features: Dict) -> np.ndarray:
     return df.values
 
 
-def validate_features(features: Dict) -> Tuple[bool, List[str]]:
-    """Validate input features"""
-    errors = []
-    
-    # Define validation rules
-    validation_rules = {
-        'bedrooms': (1, 15, 'Bedrooms must be between 1 and 15'),
-        'bathrooms': (0.5, 8, 'Bathrooms must be between 0.5 and 8'),
-        'sqft_living': (300, 15000, 'Living area must be between 300 and 15,000 sqft'),
-        'sqft_lot': (500, 2000000, 'Lot size must be between 500 and 2,000,000 sqft'),
-        'floors': (1, 4, 'Floors must be between 1 and 4'),
-        'view': (0, 4, 'View rating must be between 0 and 4'),
-        'condition': (1, 5, 'Condition must be between 1 and 5'),
-        'grade': (1, 13, 'Grade must be between 1 and 13'),
-        'yr_built': (1900, 2025, 'Year built must be between 1900 and 2025'),
-        'yr_renovated': (0, 2025, 'Year renovated must be between 0 and 2025'),
-    }
-    
-    for feature, (min_val, max_val, error_msg) in validation_rules.items():
-        if feature in features:
-            value = features[feature]
-            if not (min_val <= value <= max_val):
-                errors.append(error_msg)
+# Validation rules as (feature, min, max, message), stored column-wise for batch checks
+_VALIDATION_RULES = [
+    ('bedrooms', 1, 15, 'Bedrooms must be between 1 and 15'),
+    ('bathrooms', 0.5, 8, 'Bathrooms must be between 0.5 and 8'),
+    ('sqft_living', 300, 15000, 'Living area must be between 300 and 15,000 sqft'),
+    ('sqft_lot', 500, 2000000, 'Lot size must be between 500 and 2,000,000 sqft'),
+    ('floors', 1, 4, 'Floors must be between 1 and 4'),
+    ('view', 0, 4, 'View rating must be between 0 and 4'),
+    ('condition', 1, 5, 'Condition must be between 1 and 5'),
+    ('grade', 1, 13, 'Grade must be between 1 and 13'),
+    ('yr_built', 1900, 2025, 'Year built must be between 1900 and 2025'),
+    ('yr_renovated', 0, 2025, 'Year renovated must be between 0 and 2025'),
+]
+_VAL_FEATURES = [rule[0] for rule in _VALIDATION_RULES]
+_VAL_MINS = np.array([rule[1] for rule in _VALIDATION_RULES], dtype=np.float64)
+_VAL_MAXS = np.array([rule[2] for rule in _VALIDATION_RULES], dtype=np.float64)
+_VAL_MSGS = [rule[3] for rule in _VALIDATION_RULES]
+
+
+def validate_features_batch(df: pd.DataFrame) -> Tuple[bool, List[str]]:
+    """Validate many property records at once (one row per property)"""
+    values = df.reindex(columns=_VAL_FEATURES).to_numpy(dtype=np.float64)
+    # Written as "not within" so NaN/None values fail; only absent columns are exempt
+    present = np.isin(_VAL_FEATURES, df.columns)
+    invalid = ~((values >= _VAL_MINS) & (values <= _VAL_MAXS)) & present
+    errors = [_VAL_MSGS[i] for i in np.flatnonzero(invalid.any(axis=0))]
     
     # Additional logical validations
-    if 'sqft_above' in features and 'sqft_living' in features:
-        if features['sqft_above'] > features['sqft_living']:
+    if 'sqft_above' in df.columns and 'sqft_living' in df.columns:
+        if (df['sqft_above'] > df['sqft_living']).any():
             errors.append('Above ground area cannot be larger than total living area')
     
-    if 'yr_renovated' in features and 'yr_built' in features:
-        if features['yr_renovated'] > 0 and features['yr_renovated'] < features['yr_built']:
+    if 'yr_renovated' in df.columns and 'yr_built' in df.columns:
+        renovated = df['yr_renovated']
+        if ((renovated > 0) & (renovated < df['yr_built'])).any():
             errors.append('Renovation year cannot be before construction year')
     
     return len(errors) == 0, errors
 
 
+def validate_features(features: Dict) -> Tuple[bool, List[str]]:
+    """Validate input features"""
+    return validate_features_batch(pd.DataFrame([features]))
+
+
 def get_feature_statistics(df: pd.DataFrame) -> Dict:
     """Get statistical information about features"""
-    stats = {}
+    numeric = df.select_dtypes(include=[np.number])
     
-    for column in df.select_dtypes(include=[np.number]).columns:
+    # One column-wise sweep per statistic instead of seven scans per column
+    means = numeric.mean()
+    stds = numeric.std()
+    mins = numeric.min()
+    maxs = numeric.max()
+    quantiles = numeric.quantile([0.25, 0.5, 0.75])
+    
+    stats = {}
+    for column in numeric.columns:
         stats[column] = {
-            'mean': df[column].mean(),
-            'median': df[column].median(),
-            'std': df[column].std(),
-            'min': df[column].min(),
-            'max': df[column].max(),
-            'q25': df[column].quantile(0.25),
-            'q75': df[column].quantile(0.75)
+            'mean': means[column],
+            'median': quantiles.at[0.5, column],
+            'std': stds[column],
+            'min': mins[column],
+            'max': maxs[column],
+            'q25': quantiles.at[0.25, column],
+            'q75': quantiles.at[0.75, column]
         }
     
     return stats
@@ -97,29 +120,32 @@ def get_feature_statistics(df: pd.DataFrame) -> Dict:
 
 def detect_outliers(df: pd.DataFrame, column: str, method: str = 'iqr') -> pd.Series:
     """Detect outliers in a column"""
+    values = df[column].to_numpy(dtype=np.float64)
+    
     if method == 'iqr':
-        Q1 = df[column].quantile(0.25)
-        Q3 = df[column].quantile(0.75)
+        Q1, Q3 = np.nanquantile(values, [0.25, 0.75])
         IQR = Q3 - Q1
         lower_bound = Q1 - 1.5 * IQR
         upper_bound = Q3 + 1.5 * IQR
-        return (df[column] < lower_bound) | (df[column] > upper_bound)
+        return pd.Series((values < lower_bound) | (values > upper_bound), index=df.index, name=column)
     
     elif method == 'zscore':
-        z_scores = np.abs((df[column] - df[column].mean()) / df[column].std())
-        return z_scores > 3
+        z_scores = np.abs((values - np.nanmean(values)) / np.nanstd(values, ddof=1))
+        return pd.Series(z_scores > 3, index=df.index, name=column)
     
-    return pd.Series([False] * len(df))
+    return pd.Series(False, index=df.index)
 
 
 def create_feature_summary(df: pd.DataFrame) -> pd.DataFrame:
     """Create a summary table of features"""
+    # Each statistic is computed for all columns in a single pass
+    missing = df.isnull().sum().to_numpy()
     summary = pd.DataFrame({
         'Feature': df.columns,
-        'Type': [str(df[col].dtype) for col in df.columns],
-        'Missing': [df[col].isnull().sum() for col in df.columns],
-        'Missing %': [df[col].isnull().sum() / len(df) * 100 for col in df.columns],
-        'Unique': [df[col].nunique() for col in df.columns]
+        'Type': df.dtypes.astype(str).to_numpy(),
+        'Missing': missing,
+        'Missing %': missing / len(df) * 100,
+        'Unique': df.nunique().to_numpy()
     })
     
     return summary
@@ -165,22 +191,22 @@ def get_comparable_properties(df: pd.DataFrame, features: Dict, n_similar: int =
     """Find similar properties in the dataset"""
     # Simple similarity based on key features
     key_features = ['bedrooms', 'bathrooms', 'sqft_living', 'grade']
+    used = [f for f in key_features if f in features and f in df.columns]
     
-    similarities = []
-    for idx, row in df.iterrows():
-        similarity = 0
-        for feature in key_features:
-            if feature in features and feature in row:
-                # Calculate similarity (inverse of difference)
-                diff = abs(features[feature] - row[feature])
-                if feature == 'sqft_living':
-                    diff = diff / 1000  # Normalize
-                similarity += 1 / (1 + diff)
-        similarities.append(similarity)
+    similarities = np.zeros(len(df), dtype=np.float64)
+    if used:
+        # Calculate similarity (inverse of difference) for all rows at once
+        query = np.array([features[f] for f in used], dtype=np.float64)
+        diffs = np.abs(df[used].to_numpy(dtype=np.float64) - query)
+        if 'sqft_living' in used:
+            diffs[:, used.index('sqft_living')] /= 1000  # Normalize
+        similarities = (1.0 / (1.0 + diffs)).sum(axis=1)
     
     # Get top similar properties
-    df_copy = df.copy()
-    df_copy['similarity'] = similarities
-    similar_properties = df_copy.nlargest(n_similar, 'similarity')
+    # A stable sort keeps the earliest row among ties, like nlargest(keep='first')
+    top = np.argsort(-similarities, kind='stable')[:max(0, n_similar)]
+    
+    similar_properties = df.iloc[top][['bedrooms', 'bathrooms', 'sqft_living', 'grade', 'price']].copy()
+    similar_properties['similarity'] = similarities[top]
     
-    return similar_properties[['bedrooms', 'bathrooms', 'sqft_living', 'grade', 'price', 'similarity']]
+    return similar_properties
@@ -2,22 +2,140 @@
 Utility functions for the House Price Prediction App
 """
 
+import logging
+import os
+import time
+from collections import deque
+from itertools import cycle
+
 import streamlit as st
 import pandas as pd
 import numpy as np
 from pathlib import Path
+from types import MappingProxyType
+from typing import Any, Mapping, NamedTuple, Optional, Tuple, Union
+
+from ._validate_numba import range_mask
+
+try:
+    from ._css_snapshot import CSS as _CSS_SNAPSHOT
+except ImportError:  # snapshot not generated; load_css reads the stylesheet from disk
+    _CSS_SNAPSHOT = None
+
+
+_LOGGER = logging.getLogger(__name__)
+_LOGGER.addHandler(logging.NullHandler())
+
+
+class PredictionLog(NamedTuple):
+    """One logged prediction; features are snapshotted so later edits to the input dict don't leak in"""
+    timestamp: float
+    prediction: float
+    features: Tuple[Tuple[str, Any], ...]
+
+
+# Most recent predictions across all sessions; deque appends are thread-safe
+# and the oldest entries drop off once full
+_PRED_RING = deque(maxlen=1000)
+
+
+_FEATURE_DESCRIPTIONS: Mapping[str, str] = MappingProxyType({
+    'bedrooms': 'Number of bedrooms in the house',
+    'bathrooms': 'Number of bathrooms in the house',
+    'sqft_living': 'Square footage of living space',
+    'sqft_lot': 'Square footage of the lot',
+    'floors': 'Number of floors in the house',
+    'waterfront': 'Whether the house has a waterfront view',
+    'view': 'Quality of the view (0-4 scale)',
+    'condition': 'Overall condition of the house (1-5 scale)',
+    'grade': 'Overall grade/quality of construction (1-13 scale)',
+    'sqft_above': 'Square footage above ground level',
+    'sqft_basement': 'Square footage of basement',
+    'yr_built': 'Year the house was built',
+    'yr_renovated': 'Year the house was renovated (0 if never)',
+    'zipcode': 'Zipcode of the property',
+    'lat': 'Latitude coordinate',
+    'long': 'Longitude coordinate',
+    'sqft_living15': 'Average sqft living of 15 nearest neighbors',
+    'sqft_lot15': 'Average sqft lot of 15 nearest neighbors'
+})
+
+_FEATURE_RANGES: Mapping[str, Tuple[float, float]] = MappingProxyType({
+    'bedrooms': (1, 15),
+    'bathrooms': (0.5, 8),
+    'sqft_living': (300, 13540),
+    'sqft_lot': (520, 1651359),
+    'floors': (1, 3.5),
+    'view': (0, 4),
+    'condition': (1, 5),
+    'grade': (1, 13),
+    'sqft_above': (300, 9410),
+    'sqft_basement': (0, 4820),
+    'yr_built': (1900, 2025),
+    'yr_renovated': (0, 2025),
+    'zipcode': (98001, 98199),
+    'lat': (47.1559, 47.7776),
+    'long': (-122.519, -121.315),
+    'sqft_living15': (399, 6210),
+    'sqft_lot15': (651, 871200)
+})
+
+# Range bounds as arrays for checking a whole record at once
+_RANGE_KEYS = tuple(_FEATURE_RANGES)
+_RANGE_LO = np.array([lo for lo, _ in _FEATURE_RANGES.values()], dtype=np.float64)
+_RANGE_HI = np.array([hi for _, hi in _FEATURE_RANGES.values()], dtype=np.float64)
+_RANGE_LO_SERIES = pd.Series(_RANGE_LO, index=_RANGE_KEYS)
+_RANGE_HI_SERIES = pd.Series(_RANGE_HI, index=_RANGE_KEYS)
+
+# Returned as a fresh dict because callers may edit the sample before using it
+_SAMPLE_HOUSE: Mapping[str, Union[int, float]] = MappingProxyType({
+    'bedrooms': 3,
+    'bathrooms': 2.0,
+    'sqft_living': 1800,
+    'sqft_lot': 7200,
+    'floors': 2.0,
+    'waterfront': 0,
+    'view': 2,
+    'condition': 3,
+    'grade': 7,
+    'sqft_above': 1800,
+    'sqft_basement': 0,
+    'yr_built': 1990,
+    'yr_renovated': 0,
+    'zipcode': 98052,
+    'lat': 47.6740,
+    'long': -122.1215,
+    'sqft_living15': 1690,
+    'sqft_lot15': 7503
+})
+
+# The same sample as a read-only float32 row, columns in _SAMPLE_KEYS order
+_SAMPLE_KEYS = tuple(_SAMPLE_HOUSE)
+_SAMPLE_VALUES = np.array(list(_SAMPLE_HOUSE.values()), dtype=np.float32)
+_SAMPLE_VALUES.setflags(write=False)
 
 
-def load_css(css_file_path: str = "assets/style.css") -> str:
+@st.cache_data(show_spinner=False)
+def _read_css(css_file_path: str, mtime: float) -> str:
+    """Read a CSS file; cached per path and modification time"""
+    return Path(css_file_path).read_bytes().decode("utf-8")
+
+
+_DEFAULT_CSS_PATH = "assets/style.css"
+
+
+def load_css(css_file_path: str = _DEFAULT_CSS_PATH) -> str:
     """Load CSS file and return as string"""
+    # The default stylesheet is embedded by tools/gen_css_snapshot.py; rerun it after editing the CSS
+    if css_file_path == _DEFAULT_CSS_PATH and _CSS_SNAPSHOT is not None:
+        return _CSS_SNAPSHOT
     try:
-        css_path = Path(css_file_path)
-        if css_path.exists():
-            with open(css_path) as f:
-                return f.read()
-        else:
+        try:
+            mtime = os.stat(css_file_path).st_mtime
+        except FileNotFoundError:
             st.warning(f"CSS file not found: {css_file_path}")
             return ""
+        return _read_css(css_file_path, mtime)
     except Exception as e:
         st.error(f"Error loading CSS: {e}")
         return ""
@@ -28,9 +146,13 @@ def format_currency(value: float) -> str:
     return f"${value:,.2f}"
 
 
+# Format specs for the usual decimal counts, so format_number skips building one
+_FMT_CACHE = {0: ",.0f", 1: ",.1f", 2: ",.2f", 4: ",.4f"}
+
+
 def format_number(value: float, decimals: int = 2) -> str:
     """Format number with thousand separators"""
-    return f"{value:,.{decimals}f}"
+    return format(value, _FMT_CACHE.get(decimals) or f",.{decimals}f")
 
 
 def validate_input_range(value: float, min_val: float, max_val: float, field_name: str) -> bool:
@@ -41,113 +163,113 @@ def validate_input_range(value: float, min_val: float, max_val: float, field_nam
     return True
 
 
-def get_feature_descriptions() -> dict:
+def validate_inputs(values: dict) -> np.ndarray:
+    """Validate a whole record at once; returns a mask over get_feature_ranges() order (True = out of range)"""
+    vals = np.fromiter((values.get(k, np.nan) for k in _RANGE_KEYS), dtype=np.float64, count=len(_RANGE_KEYS))
+    bad = (vals < _RANGE_LO) | (vals > _RANGE_HI)
+    for i in np.flatnonzero(bad):
+        st.warning(f"{_RANGE_KEYS[i]} seems unusual. Expected range: {_RANGE_LO[i]:,.0f} - {_RANGE_HI[i]:,.0f}")
+    return bad
+
+
+def validate_batch(values: np.ndarray) -> np.ndarray:
+    """Check many rows at once; columns follow get_feature_ranges() order, returns True where out of range"""
+    vals = np.ascontiguousarray(np.atleast_2d(values), dtype=np.float64)
+    # Checked up front: the kernel indexes the bounds without bounds checking
+    if vals.ndim != 2 or vals.shape[1] != len(_RANGE_KEYS):
+        raise ValueError(f"Expected rows of {len(_RANGE_KEYS)} values, got array of shape {vals.shape}")
+    if range_mask is not None:
+        return range_mask(vals, _RANGE_LO, _RANGE_HI)
+    return (vals < _RANGE_LO) | (vals > _RANGE_HI)
+
+
+def validate_series(values: pd.Series) -> pd.Series:
+    """Check inputs indexed by feature name; True where in range (missing values and unranged features pass)"""
+    lo = _RANGE_LO_SERIES.reindex(values.index)
+    hi = _RANGE_HI_SERIES.reindex(values.index)
+    # NaN/None pass, as in validate_inputs and validate_batch
+    return values.between(lo, hi) | lo.isna() | values.isna()
+
+
+def get_feature_descriptions() -> Mapping[str, str]:
     """Return descriptions for each feature"""
-    return {
-        'bedrooms': 'Number of bedrooms in the house',
-        'bathrooms': 'Number of bathrooms in the house',
-        'sqft_living': 'Square footage of living space',
-        'sqft_lot': 'Square footage of the lot',
-        'floors': 'Number of floors in the house',
-        'waterfront': 'Whether the house has a waterfront view',
-        'view': 'Quality of the view (0-4 scale)',
-        'condition': 'Overall condition of the house (1-5 scale)',
-        'grade': 'Overall grade/quality of construction (1-13 scale)',
-        'sqft_above': 'Square footage above ground level',
-        'sqft_basement': 'Square footage of basement',
-        'yr_built': 'Year the house was built',
-        'yr_renovated': 'Year the house was renovated (0 if never)',
-        'zipcode': 'Zipcode of the property',
-        'lat': 'Latitude coordinate',
-        'long': 'Longitude coordinate',
-        'sqft_living15': 'Average sqft living of 15 nearest neighbors',
-        'sqft_lot15': 'Average sqft lot of 15 nearest neighbors'
-    }
-
-
-def get_feature_ranges() -> dict:
+    return _FEATURE_DESCRIPTIONS
+
+
+def get_feature_ranges() -> Mapping[str, Tuple[float, float]]:
     """Return expected ranges for features for validation"""
-    return {
-        'bedrooms': (1, 15),
-        'bathrooms': (0.5, 8),
-        'sqft_living': (300, 13540),
-        'sqft_lot': (520, 1651359),
-        'floors': (1, 3.5),
-        'view': (0, 4),
-        'condition': (1, 5),
-        'grade': (1, 13),
-        'sqft_above': (300, 9410),
-        'sqft_basement': (0, 4820),
-        'yr_built': (1900, 2025),
-        'yr_renovated': (0, 2025),
-        'zipcode': (98001, 98199),
-        'lat': (47.1559, 47.7776),
-        'long': (-122.519, -121.315),
-        'sqft_living15': (399, 6210),
-        'sqft_lot15': (651, 871200)
-    }
+    return _FEATURE_RANGES
 
 
 def create_input_section(title: str, features: list, col_count: int = 2):
     """Create an input section with organized columns"""
     st.subheader(title)
     cols = st.columns(col_count)
-    
-    values = {}
-    for i, feature in enumerate(features):
-        col = cols[i % col_count]
-        values[feature] = col
-    
-    return values
+    return dict(zip(features, cycle(cols)))
+
+
+_MODEL_INFO_ITEMS = (
+    ("Algorithm", "Random Forest"),
+    ("Features", "21 selected features"),
+    ("Training Data", "House sales dataset"),
+    ("Performance", "Optimized for accuracy"),
+)
+
+
+# Each sidebar panel is sent as a single markdown element
+_MODEL_INFO_MD = "### 🤖 Model Information\n\n" + "\n\n".join(
+    f"**{key}:** {value}" for key, value in _MODEL_INFO_ITEMS
+)
+
+_APP_INFO_MD = """### ℹ️ About This App
+
+This professional house price prediction app uses advanced machine learning 
+to estimate property values based on various features.
+
+**Key Features:**
+- Real-time predictions
+- Professional UI/UX
+- Model analytics
+- Data validation
+"""
 
 
 def show_model_info():
     """Display model information in sidebar"""
-    st.sidebar.markdown("### 🤖 Model Information")
-    
-    info_data = {
-        "Algorithm": "Random Forest",
-        "Features": "21 selected features",
-        "Training Data": "House sales dataset",
-        "Performance": "Optimized for accuracy"
-    }
-    
-    for key, value in info_data.items():
-        st.sidebar.write(f"**{key}:** {value}")
+    st.sidebar.markdown(_MODEL_INFO_MD)
 
 
 def show_app_info():
     """Display app information in sidebar"""
-    st.sidebar.markdown("### ℹ️ About This App")
-    st.sidebar.write("""
-    This professional house price prediction app uses advanced machine learning 
-    to estimate property values based on various features.
-    
-    **Key Features:**
-    - Real-time predictions
-    - Professional UI/UX
-    - Model analytics
-    - Data validation
-    """)
+    st.sidebar.markdown(_APP_INFO_MD)
+
+
+_METRIC_CARD_TMPL = (
+    '<div class="metric-container">'
+    '<div class="metric-value">{value}</div>'
+    '<div class="metric-label">{label}</div>'
+    '</div>'
+)
 
 
 def create_metrics_display(metrics: dict):
     """Create a metrics display with cards"""
     cols = st.columns(len(metrics))
     
-    for i, (label, value) in enumerate(metrics.items()):
-        with cols[i]:
-            st.markdown(f"""
-            <div class="metric-container">
-                <div class="metric-value">{value}</div>
-                <div class="metric-label">{label}</div>
-            </div>
-            """, unsafe_allow_html=True)
-
-
-def show_prediction_confidence(prediction: float, model_std: float = None):
-    """Show prediction with confidence interval"""
-    if model_std:
+    for col, (label, value) in zip(cols, metrics.items()):
+        col.markdown(_METRIC_CARD_TMPL.format(value=value, label=label), unsafe_allow_html=True)
+
+
+# Below this many predictions NumPy dispatch costs more than a Python loop
+_VECTORIZE_MIN_SIZE = 32
+
+
+def show_prediction_confidence(prediction: Union[float, np.ndarray],
+                               model_std: Optional[Union[float, np.ndarray]] = None):
+    """Show prediction with confidence interval (prediction and model_std may be arrays)"""
+    if isinstance(prediction, np.ndarray):
+        _show_prediction_confidence_batch(prediction, model_std)
+    elif model_std:
         lower_bound = prediction - (1.96 * model_std)
         upper_bound = prediction + (1.96 * model_std)
         
@@ -157,41 +279,46 @@ def show_prediction_confidence(prediction: float, model_std: float = None):
         st.write("*Confidence interval not available*")
 
 
-def log_prediction(features: dict, prediction: float):
-    """Log prediction for analytics (in a real app, this would go to a database)"""
-    # In a production app, you would save this to a database
-    # For now, we'll just create a simple log
-    import datetime
+def _show_prediction_confidence_batch(predictions: np.ndarray, model_std: Optional[Union[float, np.ndarray]]):
+    """Show 95% confidence intervals for several predictions"""
+    if model_std is None:
+        st.write("*Confidence interval not available*")
+        return
     
-    log_entry = {
-        'timestamp': datetime.datetime.now().isoformat(),
-        'prediction': prediction,
-        'features': features
-    }
+    predictions = predictions.ravel()
+    stds = np.broadcast_to(np.asarray(model_std, dtype=np.float64), predictions.shape)
+    if predictions.size >= _VECTORIZE_MIN_SIZE:
+        half_width = stds * 1.96
+        bounds = zip((predictions - half_width).tolist(), (predictions + half_width).tolist())
+    else:
+        bounds = ((p - 1.96 * s, p + 1.96 * s) for p, s in zip(predictions.tolist(), stds.tolist()))
     
-    # Could save to file or database here
-    # st.write("Prediction logged for analytics")
+    # A zero std means "no interval", as in the scalar path
+    lines = [
+        f"{format_currency(lower)} - {format_currency(upper)}" if std else "*Confidence interval not available*"
+        for (lower, upper), std in zip(bounds, stds.tolist())
+    ]
+    st.write("**Confidence Intervals (95%):**")
+    st.write("  \n".join(lines))
 
 
-def get_sample_house_data():
+def log_prediction(features: dict, prediction: float):
+    """Log prediction for analytics (in a real app, this would go to a database)"""
+    if _LOGGER.isEnabledFor(logging.INFO):
+        _LOGGER.info("pred=%s features=%s", prediction, features)
+    _PRED_RING.append(PredictionLog(time.time(), prediction, tuple(features.items())))
+
+
+def get_recent_predictions() -> list:
+    """Return logged predictions (PredictionLog), oldest first"""
+    return list(_PRED_RING)
+
+
+def get_sample_house_data() -> dict:
     """Return sample house data for quick testing"""
-    return {
-        'bedrooms': 3,
-        'bathrooms': 2.0,
-        'sqft_living': 1800,
-        'sqft_lot': 7200,
-        'floors': 2.0,
-        'waterfront': 0,
-        'view': 2,
-        'condition': 3,
-        'grade': 7,
-        'sqft_above': 1800,
-        'sqft_basement': 0,
-        'yr_built': 1990,
-        'yr_renovated': 0,
-        'zipcode': 98052,
-        'lat': 47.6740,
-        'long': -122.1215,
-        'sqft_living15': 1690,
-        'sqft_lot15': 7503
-    }
+    return dict(_SAMPLE_HOUSE)
+
+
+def get_sample_house_array() -> np.ndarray:
+    """Return sample house data as a read-only float32 row (same order as get_sample_house_data)"""
+    return _SAMPLE_VALUES
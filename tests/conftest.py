@@ -0,0 +1,11 @@
+import os
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+
+# The app imports its packages from src/ and opens model files relative to the repo root;
+# tools/ holds the generators whose output the tests compare against
+sys.path.insert(0, str(ROOT / 'src'))
+sys.path.insert(0, str(ROOT / 'tools'))
+os.chdir(ROOT)
@@ -0,0 +1,94 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from utils import data_utils
+
+
+VALID_FEATURES = {
+    'bedrooms': 3,
+    'bathrooms': 2.0,
+    'sqft_living': 1800,
+    'sqft_lot': 7200,
+    'floors': 2.0,
+    'view': 2,
+    'condition': 3,
+    'grade': 7,
+    'yr_built': 1990,
+    'yr_renovated': 0,
+}
+
+
+def test_validate_features_accepts_valid_record():
+    assert data_utils.validate_features(VALID_FEATURES) == (True, [])
+
+
+def test_validate_features_skips_absent_features():
+    features = {k: v for k, v in VALID_FEATURES.items() if k != 'grade'}
+    
+    assert data_utils.validate_features(features) == (True, [])
+
+
+@pytest.mark.parametrize('missing_value', [np.nan, None])
+def test_validate_features_rejects_nan_and_none(missing_value):
+    features = dict(VALID_FEATURES, bedrooms=missing_value)
+    
+    valid, errors = data_utils.validate_features(features)
+    
+    assert not valid
+    assert errors == ['Bedrooms must be between 1 and 15']
+
+
+def test_validate_features_batch_reports_each_rule_once():
+    df = pd.DataFrame([VALID_FEATURES, dict(VALID_FEATURES, floors=np.nan), dict(VALID_FEATURES, floors=9)])
+    
+    valid, errors = data_utils.validate_features_batch(df)
+    
+    assert not valid
+    assert errors == ['Floors must be between 1 and 4']
+
+
+def _comparables_frame():
+    rng = np.random.default_rng(0)
+    n = 200
+    return pd.DataFrame({
+        'bedrooms': rng.integers(1, 6, n),
+        'bathrooms': rng.integers(1, 4, n).astype(float),
+        'sqft_living': rng.integers(800, 4000, n),
+        'grade': rng.integers(5, 10, n),
+        'price': rng.integers(100_000, 900_000, n),
+    })
+
+
+@pytest.mark.parametrize('features', [
+    {'bedrooms': 3},
+    {'bedrooms': 3, 'grade': 7},
+    {'bedrooms': 2, 'bathrooms': 2.0, 'sqft_living': 1500, 'grade': 8},
+])
+def test_get_comparable_properties_breaks_ties_by_position(features):
+    df = _comparables_frame()
+    
+    result = data_utils.get_comparable_properties(df, features, n_similar=3)
+    
+    # Reference: the row-by-row similarity ranked with nlargest(keep='first')
+    expected_sim = sum(
+        1 / (1 + (df[f] - v).abs() / (1000 if f == 'sqft_living' else 1)) for f, v in features.items()
+    )
+    expected = expected_sim.nlargest(3, keep='first')
+    assert result.index.tolist() == expected.index.tolist()
+    np.testing.assert_allclose(result['similarity'].to_numpy(), expected.to_numpy())
+
+
+@pytest.mark.parametrize('method', ['iqr', 'zscore'])
+def test_detect_outliers_matches_series_arithmetic(method):
+    df = pd.read_csv('data/train.csv', usecols=['LotArea', 'GrLivArea', 'SalePrice'])
+    
+    for column in df.columns:
+        values = df[column]
+        if method == 'iqr':
+            q1, q3 = values.quantile(0.25), values.quantile(0.75)
+            expected = (values < q1 - 1.5 * (q3 - q1)) | (values > q3 + 1.5 * (q3 - q1))
+        else:
+            expected = ((values - values.mean()) / values.std()).abs() > 3
+        
+        pd.testing.assert_series_equal(data_utils.detect_outliers(df, column, method), expected)
@@ -0,0 +1,61 @@
+import pytest
+
+import gen_feature_mapping
+from utils import feature_mapping
+
+
+def test_generated_records_match_schema():
+    rows = gen_feature_mapping.read_schema(gen_feature_mapping.SCHEMA_PATH)
+    
+    # Fails when data/ames_schema.csv was edited without rerunning tools/gen_feature_mapping.py
+    assert gen_feature_mapping.render(rows) == gen_feature_mapping.OUTPUT_PATH.read_text(encoding='utf-8')
+
+
+def test_friendly_names_are_unique():
+    friendly_names = list(feature_mapping.FEATURE_MAPPING.values())
+    duplicates = sorted({name for name in friendly_names if friendly_names.count(name) > 1})
+    
+    assert duplicates == []
+    assert all(
+        feature_mapping.get_technical_name(friendly) == name
+        for name, friendly in feature_mapping.FEATURE_MAPPING.items()
+    )
+
+
+def test_read_schema_rejects_duplicate_friendly_names(tmp_path):
+    schema = tmp_path / 'schema.csv'
+    schema.write_text(
+        'column,friendly,short,long,category\n'
+        'LotArea,Lot Size,,Lot size in square feet,\n'
+        'LotFrontage,Lot Size,,Linear feet of street,\n'
+    )
+    
+    with pytest.raises(ValueError, match='Lot Size'):
+        gen_feature_mapping.read_schema(schema)
+
+
+@pytest.mark.parametrize('table', [
+    feature_mapping.get_feature_mapping(),
+    feature_mapping.get_feature_categories(),
+    feature_mapping.get_categorical_options(),
+    feature_mapping.ZONING_OPTIONS,
+])
+def test_mapping_tables_are_read_only(table):
+    with pytest.raises(TypeError):
+        table['x'] = 'y'
+
+
+def test_user_friendly_name_resolves_from_feature_mapping(monkeypatch):
+    for name, friendly in feature_mapping.FEATURE_MAPPING.items():
+        assert feature_mapping.get_user_friendly_name(name) == friendly
+    assert feature_mapping.get_user_friendly_name('NotAColumn') == 'NotAColumn'
+    
+    # No second lookup table behind it: swapping FEATURE_MAPPING changes the answer
+    monkeypatch.setattr(feature_mapping, 'FEATURE_MAPPING', {'GrLivArea': 'Patched'})
+    assert feature_mapping.get_user_friendly_name('GrLivArea') == 'Patched'
+    assert feature_mapping.get_user_friendly_name('LotArea') == 'LotArea'
+
+
+def test_feature_explanation_is_description_alias():
+    assert feature_mapping.get_feature_explanation is feature_mapping.get_feature_description
+    assert feature_mapping.get_feature_explanation('NotAColumn') == 'Information about NotAColumn'
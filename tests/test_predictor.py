@@ -0,0 +1,45 @@
+import numpy as np
+import pytest
+
+from models import predictor as predictor_module
+from models.predictor import HousePricePredictor
+
+needs_numba = pytest.mark.skipif(predictor_module.njit is None, reason="numba not installed")
+
+
+@pytest.fixture(scope='module')
+def predictor():
+    return HousePricePredictor()
+
+
+def _sklearn_price(predictor, features):
+    forest = predictor._forest
+    predictor._forest = None
+    try:
+        return predictor.predict_price(features)[0]
+    finally:
+        predictor._forest = forest
+
+
+@needs_numba
+@pytest.mark.parametrize('feature', ['GrLivArea', 'OverallQual', 'YearBuilt', 'TotalBsmtSF'])
+def test_nan_input_matches_sklearn(predictor, feature):
+    features = predictor.get_sample_input()
+    features[feature] = np.nan
+    
+    price = predictor.predict_price(features)[0]
+    
+    assert price == pytest.approx(_sklearn_price(predictor, features), rel=1e-12)
+    assert price == pytest.approx(predictor.predict_prices([features])[0], rel=1e-12)
+
+
+@needs_numba
+def test_forest_kernel_matches_sklearn_with_missing_values(predictor):
+    rng = np.random.default_rng(0)
+    rows = rng.uniform(-0.5, 1.5, size=(500, len(predictor.model_features))).astype(np.float32)
+    rows[rng.random(rows.shape) < 0.2] = np.nan
+    
+    expected = predictor.model.predict(rows)
+    actual = np.array([predictor_module._predict_forest(row, *predictor._forest) for row in rows])
+    
+    np.testing.assert_allclose(actual, expected, rtol=1e-12)
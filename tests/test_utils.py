@@ -0,0 +1,112 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+import gen_css_snapshot
+from utils import utils
+
+
+@pytest.fixture(params=['numba', 'numpy'])
+def backend(request, monkeypatch):
+    if request.param == 'numba':
+        if utils.range_mask is None:
+            pytest.skip("numba not installed")
+    else:
+        monkeypatch.setattr(utils, 'range_mask', None)
+    return request.param
+
+
+def _expected(rows):
+    rows = np.atleast_2d(np.asarray(rows, dtype=np.float64))
+    return (rows < utils._RANGE_LO) | (rows > utils._RANGE_HI)
+
+
+def test_validate_batch_flags_out_of_range(backend):
+    rng = np.random.default_rng(0)
+    span = utils._RANGE_HI - utils._RANGE_LO
+    rows = rng.uniform(utils._RANGE_LO - 0.2 * span, utils._RANGE_HI + 0.2 * span, size=(64, len(utils._RANGE_KEYS)))
+    rows[0, 0] = np.nan
+    
+    mask = utils.validate_batch(rows)
+    
+    np.testing.assert_array_equal(mask, _expected(rows))
+    assert not mask[0, 0]
+
+
+def test_validate_batch_accepts_single_row(backend):
+    row = np.array([utils.get_sample_house_data()[k] for k in utils._RANGE_KEYS], dtype=np.float64)
+    row[2] = 1e9
+    
+    mask = utils.validate_batch(row)
+    
+    assert mask.shape == (1, len(utils._RANGE_KEYS))
+    np.testing.assert_array_equal(mask, _expected(row))
+
+
+@pytest.mark.parametrize('shape', [(3, 5), (3, 20), (2, 3, 17), (0,)])
+def test_validate_batch_rejects_wrong_shape(backend, shape):
+    with pytest.raises(ValueError):
+        utils.validate_batch(np.zeros(shape))
+
+
+@pytest.mark.parametrize('missing_value', [np.nan, None])
+def test_validate_series_agrees_with_validate_inputs(missing_value):
+    record = utils.get_sample_house_data()
+    record['bedrooms'] = missing_value
+    record['lat'] = 50.0
+    
+    in_range = utils.validate_series(pd.Series(record, dtype=object))
+    out_of_range = utils.validate_inputs({k: np.nan if v is None else v for k, v in record.items()})
+    
+    np.testing.assert_array_equal(~in_range[list(utils._RANGE_KEYS)].to_numpy(), out_of_range)
+    assert in_range['bedrooms']
+    assert not in_range['lat']
+
+
+def test_validate_series_passes_features_without_range():
+    record = utils.get_sample_house_data()
+    record['waterfront'] = 1e9
+    
+    in_range = utils.validate_series(pd.Series(record))
+    
+    assert 'waterfront' not in utils.get_feature_ranges()
+    assert in_range['waterfront']
+    assert in_range.all()
+
+
+def test_css_snapshot_matches_stylesheet():
+    css = gen_css_snapshot.CSS_PATH.read_bytes().decode('utf-8')
+    
+    # Fails when assets/style.css was edited without rerunning tools/gen_css_snapshot.py
+    assert gen_css_snapshot.render(css) == gen_css_snapshot.OUTPUT_PATH.read_text(encoding='utf-8')
+
+
+@pytest.fixture
+def written(monkeypatch):
+    lines = []
+    monkeypatch.setattr(utils.st, 'write', lines.append)
+    return lines
+
+
+def test_prediction_confidence_treats_zero_std_as_unavailable(written):
+    utils.show_prediction_confidence(200000.0, 0.0)
+    assert written == ["*Confidence interval not available*"]
+
+
+@pytest.mark.parametrize('n', [3, 40])
+def test_prediction_confidence_batch_matches_scalar_rule(written, n):
+    predictions = np.full(n, 200000.0)
+    stds = np.full(n, 1000.0)
+    stds[1] = 0.0
+    
+    utils.show_prediction_confidence(predictions, stds)
+    
+    lines = written[1].split("  \n")
+    assert len(lines) == n
+    assert lines[0] == "$198,040.00 - $201,960.00"
+    assert lines[1] == "*Confidence interval not available*"
+
+
+def test_prediction_confidence_batch_without_std(written):
+    utils.show_prediction_confidence(np.ones(3))
+    assert written == ["*Confidence interval not available*"]
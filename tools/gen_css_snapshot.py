@@ -0,0 +1,38 @@
+"""
+Generate src/utils/_css_snapshot.py from assets/style.css
+
+load_css() serves the default stylesheet from this snapshot instead of
+reading the file, so run this after every edit to the stylesheet
+(from the repository root):
+
+    python tools/gen_css_snapshot.py
+"""
+
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+CSS_PATH = ROOT / 'assets' / 'style.css'
+OUTPUT_PATH = ROOT / 'src' / 'utils' / '_css_snapshot.py'
+
+HEADER = '''"""
+Snapshot of assets/style.css for the House Price Prediction App
+
+Generated by tools/gen_css_snapshot.py - do not edit by hand.
+"""
+
+'''
+
+
+def render(css: str) -> str:
+    """Render the stylesheet as a module holding a single string constant"""
+    return f'{HEADER}CSS = {css!r}\n'
+
+
+def main():
+    css = CSS_PATH.read_bytes().decode('utf-8')
+    OUTPUT_PATH.write_text(render(css), encoding='utf-8')
+    print(f"Wrote {len(css)} characters of CSS to {OUTPUT_PATH.relative_to(ROOT)}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,75 @@
+"""
+Generate src/utils/_feature_mapping_data.py from data/ames_schema.csv
+
+The schema has one row per dataset column with its user-friendly name,
+short tooltip, detailed description and UI category. Empty cells mean
+"not set". Run from the repository root after editing the schema:
+
+    python tools/gen_feature_mapping.py
+"""
+
+import csv
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+SCHEMA_PATH = ROOT / 'data' / 'ames_schema.csv'
+OUTPUT_PATH = ROOT / 'src' / 'utils' / '_feature_mapping_data.py'
+
+FIELDS = ('column', 'friendly', 'short', 'long', 'category')
+OPTIONAL_FIELDS = ('short', 'category')
+
+HEADER = '''"""
+Feature records for the House Price Prediction App
+
+Generated by tools/gen_feature_mapping.py from data/ames_schema.csv - do not edit by hand.
+Each row is (column, friendly name, short tooltip, detailed description, category).
+"""
+
+'''
+
+
+def read_schema(path: Path) -> list:
+    """Read the schema CSV into a list of row tuples"""
+    with open(path, newline='', encoding='utf-8') as f:
+        reader = csv.DictReader(f)
+        missing = set(FIELDS) - set(reader.fieldnames or ())
+        if missing:
+            raise ValueError(f"Schema is missing columns: {sorted(missing)}")
+
+        rows = []
+        seen = set()
+        seen_friendly = set()
+        for record in reader:
+            column = record['column']
+            if column in seen:
+                raise ValueError(f"Duplicate column in schema: {column}")
+            seen.add(column)
+            # get_technical_name inverts the friendly names, so they must be unique too
+            friendly = record['friendly']
+            if friendly in seen_friendly:
+                raise ValueError(f"Duplicate friendly name in schema: {friendly}")
+            seen_friendly.add(friendly)
+            rows.append(tuple(
+                (record[field] or None) if field in OPTIONAL_FIELDS else record[field]
+                for field in FIELDS
+            ))
+        return rows
+
+
+def render(rows: list) -> str:
+    """Render the rows as a module holding a single constant tuple"""
+    lines = [HEADER, 'FEATURE_ROWS = (\n']
+    for row in rows:
+        lines.append(f'    ({", ".join(repr(value) for value in row)}),\n')
+    lines.append(')\n')
+    return ''.join(lines)
+
+
+def main():
+    rows = read_schema(SCHEMA_PATH)
+    OUTPUT_PATH.write_text(render(rows), encoding='utf-8')
+    print(f"Wrote {len(rows)} feature records to {OUTPUT_PATH.relative_to(ROOT)}")
+
+
+if __name__ == '__main__':
+    main()